@@ -8,14 +8,16 @@ names are pulled from nflreadpy; ratings and stats are generated locally.
 from __future__ import annotations
 
 import argparse
-import random
+import hashlib
+import itertools
 import sys
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta
+from datetime import date, time, timedelta
 from pathlib import Path
-from typing import Iterable, Sequence
-from uuid import NAMESPACE_DNS, uuid5
+from typing import Any, Sequence
+from uuid import NAMESPACE_DNS
 
+import numpy as np
 import polars as pl
 
 # `rich` is optional. The generator should still run without it.
@@ -255,11 +257,94 @@ COACH_FIRST_NAMES = [
 ]
 
 
+RATINGS_DTYPE = pl.Struct(
+    {
+        "overall": pl.Float32,
+        "athleticism": pl.Float32,
+        "technical": pl.Float32,
+        "intangibles": pl.Float32,
+        "potential": pl.Float32,
+    }
+)
+
+
+TEAMS_SCHEMA = {
+    "id": pl.Utf8,
+    "name": pl.Utf8,
+    "entity_type": pl.Utf8,
+    "era": pl.Utf8,
+    "ratings": RATINGS_DTYPE,
+    "stats": pl.Struct(
+        {
+            "wins": pl.UInt16,
+            "losses": pl.UInt16,
+            "points_for": pl.UInt16,
+            "points_against": pl.UInt16,
+            "epa_per_play": pl.Float32,
+            "success_rate": pl.Float32,
+            "turnover_diff": pl.Float32,
+            "playoff_prob": pl.Float32,
+        }
+    ),
+    "schema_version": pl.Utf8,
+    "source": pl.Utf8,
+    "updated_at": pl.Date,
+    "team": pl.Utf8,
+    "season": pl.Int64,
+    "logo_url": pl.Utf8,
+    "logo_path": pl.Utf8,
+}
+
+COACHES_SCHEMA = {
+    "id": pl.Utf8,
+    "name": pl.Utf8,
+    "entity_type": pl.Utf8,
+    "team": pl.Utf8,
+    "era": pl.Utf8,
+    "ratings": RATINGS_DTYPE,
+    "stats": pl.Struct(
+        {
+            "wins": pl.UInt16,
+            "losses": pl.UInt16,
+            "playoff_prob": pl.Float32,
+            "tenure_years": pl.Float32,
+        }
+    ),
+    "schema_version": pl.Utf8,
+    "source": pl.Utf8,
+    "updated_at": pl.Date,
+    "team_name": pl.Utf8,
+    "season": pl.Int64,
+}
+
+GAMES_SCHEMA = {
+    "id": pl.Utf8,
+    "season": pl.Int64,
+    "week": pl.Int64,
+    "home_team": pl.Utf8,
+    "away_team": pl.Utf8,
+    "location": pl.Utf8,
+    "start_time": pl.Datetime,
+    "status": pl.Utf8,
+    "is_postseason": pl.Boolean,
+    "playoff_round": pl.Utf8,
+    "home_score": pl.Int64,
+    "away_score": pl.Int64,
+    "schema_version": pl.Utf8,
+    "source": pl.Utf8,
+}
+
+
 @dataclass(frozen=True)
-class PlayerIdentity:
-    name: str
-    position: str
-    position_group: str
+class IdentityPool:
+    """Candidate player identities as parallel arrays; rosters index into them."""
+
+    names: np.ndarray
+    positions: np.ndarray
+    position_groups: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.names)
 
 
 def build_console() -> Console:
@@ -315,74 +400,106 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Schema version string to stamp onto records (defaults to config).",
     )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=1,
+        help="zstd level for Parquet outputs (1 for dev regeneration, higher for release).",
+    )
     return parser.parse_args()
 
 
-def clamp(value: float, minimum: float, maximum: float) -> float:
-    return max(minimum, min(maximum, value))
-
-
 def adjust_roster_template(
-    base_template: dict[str, int], target_size: int, rng: random.Random
+    base_template: dict[str, int], target_size: int, rng: np.random.Generator
 ) -> dict[str, int]:
     """Resize the roster template to hit a target player count per team."""
     template = dict(base_template)
     current = sum(template.values())
     if target_size <= 0:
         return template
+    keys = tuple(template)
     while current < target_size:
-        pick = rng.choice(list(template.keys()))
+        pick = keys[rng.integers(len(keys))]
         template[pick] += 1
         current += 1
-    shrinkable = [k for k, v in template.items() if v > 1]
+    # Only groups with more than one slot can shrink; drop a group once it hits 1.
+    shrinkable = [k for k in keys if template[k] > 1]
     while current > target_size and shrinkable:
-        pick = rng.choice(shrinkable)
+        pick = shrinkable[rng.integers(len(shrinkable))]
         template[pick] -= 1
         current -= 1
-        shrinkable = [k for k, v in template.items() if v > 1]
+        if template[pick] == 1:
+            shrinkable.remove(pick)
     return template
 
 
+# Raw position code -> roster position group; anything unlisted is "ATH".
+POSITION_GROUP: dict[str, str] = {
+    "QB": "QB",
+    "RB": "RB",
+    "FB": "RB",
+    "WR": "WR",
+    "TE": "TE",
+    **dict.fromkeys(("C", "G", "T", "OT", "OG", "OC", "OL"), "OL"),
+    **dict.fromkeys(("DE", "DT", "NT", "DL"), "DL"),
+    **dict.fromkeys(("ILB", "OLB", "LB", "MLB"), "LB"),
+    "CB": "CB",
+    **dict.fromkeys(("S", "SS", "FS", "SAF", "DB"), "S"),
+    "K": "K",
+    "P": "P",
+    "LS": "ST",
+}
+
+
 def position_group_for(position: str) -> str:
-    pos = position.upper()
-    if pos in {"QB"}:
-        return "QB"
-    if pos in {"RB", "FB"}:
-        return "RB"
-    if pos == "WR":
-        return "WR"
-    if pos == "TE":
-        return "TE"
-    if pos in {"C", "G", "T", "OT", "OG", "OC", "OL"}:
-        return "OL"
-    if pos in {"DE", "DT", "NT", "DL"}:
-        return "DL"
-    if pos in {"ILB", "OLB", "LB", "MLB"}:
-        return "LB"
-    if pos in {"CB"}:
-        return "CB"
-    if pos in {"S", "SS", "FS", "SAF", "DB"}:
-        return "S"
-    if pos == "K":
-        return "K"
-    if pos == "P":
-        return "P"
-    if pos == "LS":
-        return "ST"
-    return "ATH"
+    return POSITION_GROUP.get(position.upper(), "ATH")
+
+
+# Namespace prefix mixed into every id hash (same namespace uuid5 ids were derived from).
+ID_NAMESPACE = NAMESPACE_DNS.bytes
 
 
 def stable_id(*parts: str) -> str:
-    return str(uuid5(NAMESPACE_DNS, "|".join(parts)))
+    """Deterministic UUID-formatted id for the given key parts.
 
+    Uses a 16-byte blake2b digest formatted directly as hex groups; this is several
+    times faster than `uuid5` (SHA-1 + `UUID` object construction) on the hot loops.
+    """
+    digest = hashlib.blake2b(ID_NAMESPACE + "|".join(parts).encode(), digest_size=16).hexdigest()
+    return f"{digest[:8]}-{digest[8:12]}-{digest[12:16]}-{digest[16:20]}-{digest[20:]}"
 
-def load_player_identities(
-    *, start_year: int, end_year: int, rng: random.Random, console: Console
-) -> list[PlayerIdentity]:
+
+def append_row(columns: dict[str, list[object]], **values: object) -> None:
+    """Append one row to per-column lists (frames are built columnar, not from dicts)."""
+    for name, value in values.items():
+        columns[name].append(value)
+
+
+def _clean_code(column: pl.Expr) -> pl.Expr:
+    """Strip and upper-case a position code; blank or missing values become null."""
+    cleaned = column.str.strip_chars().str.to_uppercase()
+    return pl.when(cleaned.str.len_chars() > 0).then(cleaned)
+
+
+def import_nflreadpy(console: Console) -> Any | None:
+    """Import nflreadpy up front so its cold-start cost stays out of the fetch timing."""
     try:
-        import nflreadpy as nfl
+        import nflreadpy
     except Exception as exc:  # pragma: no cover - optional dependency
         console.print(f"[warning]nflreadpy unavailable: {exc}. Falling back to generated names.")
+        return None
+    return nflreadpy
+
+
+def load_player_identities(
+    *,
+    nfl: Any | None,
+    start_year: int,
+    end_year: int,
+    rng: np.random.Generator,
+    console: Console,
+) -> IdentityPool:
+    if nfl is None:
         return build_fallback_names(rng, target=2000)
 
     try:
@@ -392,23 +509,24 @@ def load_player_identities(
             & (df["last_season"].fill_null(end_year) >= start_year)
         )
         filtered = df.filter(mask)
+        position = _clean_code(pl.col("position")).fill_null("ATH")
         subset = (
             filtered.select(["display_name", "position", "position_group"])
             .drop_nulls("display_name")
             .unique("display_name")
-        )
-        identities: list[PlayerIdentity] = []
-        for row in subset.to_dicts():
-            pos = str(row.get("position") or "ATH").strip() or "ATH"
-            group = str(row.get("position_group") or position_group_for(pos)).strip() or "ATH"
-            identities.append(
-                PlayerIdentity(
-                    name=row["display_name"],
-                    position=pos.upper(),
-                    position_group=group.upper(),
-                )
+            .with_columns(position.alias("position"))
+            .with_columns(
+                _clean_code(pl.col("position_group"))
+                .fill_null(pl.col("position").replace_strict(POSITION_GROUP, default="ATH"))
+                .alias("position_group")
             )
-        if not identities:
+        )
+        identities = IdentityPool(
+            names=subset.get_column("display_name").to_numpy(),
+            positions=subset.get_column("position").to_numpy(),
+            position_groups=subset.get_column("position_group").to_numpy(),
+        )
+        if not len(identities):
             console.print(
                 "[warning]No names returned from nflreadpy; switching to fallback name pool."
             )
@@ -426,162 +544,230 @@ def load_player_identities(
         return build_fallback_names(rng, target=2000)
 
 
-def build_fallback_names(rng: random.Random, *, target: int) -> list[PlayerIdentity]:
-    identities: list[PlayerIdentity] = []
-    while len(identities) < target:
-        first = rng.choice(FALLBACK_FIRST_NAMES)
-        last = rng.choice(FALLBACK_LAST_NAMES)
-        pos = rng.choice(list(ROSTER_TEMPLATE.keys()))
-        group = position_group_for(pos)
-        identities.append(PlayerIdentity(name=f"{first} {last}", position=pos, position_group=group))
-    return identities
+def build_fallback_names(rng: np.random.Generator, *, target: int) -> IdentityPool:
+    positions = np.array(list(ROSTER_TEMPLATE.keys()))
+    groups = np.array([position_group_for(pos) for pos in positions])
+    firsts = rng.integers(len(FALLBACK_FIRST_NAMES), size=target)
+    lasts = rng.integers(len(FALLBACK_LAST_NAMES), size=target)
+    picks = rng.integers(len(positions), size=target)
+    names = [
+        f"{FALLBACK_FIRST_NAMES[first]} {FALLBACK_LAST_NAMES[last]}"
+        for first, last in zip(firsts.tolist(), lasts.tolist())
+    ]
+    return IdentityPool(
+        names=np.array(names, dtype=object),
+        positions=positions[picks],
+        position_groups=groups[picks],
+    )
 
 
-def ratings_block(rng: random.Random, *, base: float | None = None) -> dict[str, float]:
-    overall = base if base is not None else rng.normalvariate(70, 8)
-    overall = clamp(overall, 40, 99)
+def ratings_batch(overall: np.ndarray, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Sample rating facets for a batch of overalls, one array per facet."""
+    n = len(overall)
+    overall = np.clip(overall, 40, 99)
     return {
-        "overall": round(overall, 1),
-        "athleticism": round(clamp(overall + rng.normalvariate(0, 4), 35, 99), 1),
-        "technical": round(clamp(overall + rng.normalvariate(0, 5), 35, 99), 1),
-        "intangibles": round(clamp(overall + rng.normalvariate(0, 3), 35, 99), 1),
-        "potential": round(clamp(overall + rng.normalvariate(1.5, 3), 40, 99), 1),
+        "overall": np.round(overall, 1),
+        "athleticism": np.round(np.clip(overall + rng.normal(0, 4, n), 35, 99), 1),
+        "technical": np.round(np.clip(overall + rng.normal(0, 5, n), 35, 99), 1),
+        "intangibles": np.round(np.clip(overall + rng.normal(0, 3, n), 35, 99), 1),
+        "potential": np.round(np.clip(overall + rng.normal(1.5, 3, n), 40, 99), 1),
     }
 
 
-def player_stats(position: str, rng: random.Random) -> dict[str, float]:
-    # Keep this sparse: keys should exist primarily when the player actually produces
-    # that stat. (This helps UI filters treat key presence as stat availability.)
-    base: dict[str, float] = {
-        "games_played": float(rng.randint(8, 17)),
-        "snaps": float(rng.randint(150, 1150)),
-        # Used in the Leaders panel across all categories.
-        "wpa_total": round(clamp(rng.normalvariate(0.1, 0.65), -2.5, 3.5), 3),
-    }
-    pos = position.upper()
-    if pos == "QB":
-        pass_att = clamp(rng.normalvariate(540, 90), 120, 760)
-        comp_pct = clamp(rng.normalvariate(0.655, 0.05), 0.45, 0.78)
-        completions = clamp(pass_att * comp_pct + rng.normalvariate(0, 8), 60, pass_att)
-
-        base["passing_attempts"] = round(pass_att, 2)
-        base["passing_completions"] = round(completions, 2)
-        base["passing_yards"] = round(clamp(rng.normalvariate(3800, 750), 500, 6000), 2)
-        base["passing_tds"] = round(clamp(rng.normalvariate(27, 8), 2, 55), 2)
-        base["interceptions"] = round(clamp(rng.normalvariate(11, 5), 0, 30), 2)
-        base["qbr"] = round(clamp(rng.normalvariate(62, 12), 10, 98), 1)
-        base["rushing_yards"] = round(clamp(rng.normalvariate(220, 200), 0, 1200), 2)
-        base["rushing_attempts"] = round(clamp(rng.normalvariate(45, 25), 0, 170), 2)
-        base["rushing_tds"] = round(clamp(rng.normalvariate(3, 2), 0, 12), 2)
-        base["fumbles"] = round(clamp(rng.normalvariate(4, 2.5), 0, 14), 2)
-        base["rush_20_plus"] = round(clamp(rng.normalvariate(2.0, 2.0), 0, 12), 2)
-    elif pos in {"RB", "FB"}:
-        rush_att = clamp(rng.normalvariate(215, 70), 10, 380)
-        base["rushing_attempts"] = round(rush_att, 2)
-        base["rushing_yards"] = round(clamp(rng.normalvariate(980, 320), 50, 2000), 2)
-        base["rushing_tds"] = round(clamp(rng.normalvariate(8, 4), 0, 25), 2)
-        base["fumbles"] = round(clamp(rng.normalvariate(2.5, 1.8), 0, 12), 2)
-        base["rush_20_plus"] = round(clamp(rng.normalvariate(5.5, 3.5), 0, 25), 2)
-
-        targets = clamp(rng.normalvariate(55, 25), 0, 120)
-        catches = clamp(targets * clamp(rng.normalvariate(0.72, 0.08), 0.45, 0.9), 0, targets)
-        base["receiving_targets"] = round(targets, 2)
-        base["receptions"] = round(catches, 2)
-        base["receiving_yards"] = round(clamp(rng.normalvariate(310, 180), 0, 900), 2)
-        base["receiving_tds"] = round(clamp(rng.normalvariate(2, 2), 0, 10), 2)
-        base["receiving_yac"] = round(clamp(rng.normalvariate(220, 120), 0, 650), 2)
-    elif pos == "WR":
-        targets = clamp(rng.normalvariate(125, 35), 15, 210)
-        catch_pct = clamp(rng.normalvariate(0.66, 0.07), 0.4, 0.85)
-        catches = clamp(targets * catch_pct + rng.normalvariate(0, 5), 5, targets)
-        base["receiving_targets"] = round(targets, 2)
-        base["receptions"] = round(catches, 2)
-        base["receiving_yards"] = round(clamp(rng.normalvariate(1050, 350), 100, 2200), 2)
-        base["receiving_tds"] = round(clamp(rng.normalvariate(7, 3), 0, 20), 2)
-        base["receiving_yac"] = round(clamp(rng.normalvariate(420, 170), 0, 1100), 2)
-        base["fumbles"] = round(clamp(rng.normalvariate(1.2, 1.2), 0, 10), 2)
-    elif pos == "TE":
-        targets = clamp(rng.normalvariate(92, 25), 10, 160)
-        catch_pct = clamp(rng.normalvariate(0.69, 0.06), 0.45, 0.88)
-        catches = clamp(targets * catch_pct + rng.normalvariate(0, 4), 5, targets)
-        base["receiving_targets"] = round(targets, 2)
-        base["receptions"] = round(catches, 2)
-        base["receiving_yards"] = round(clamp(rng.normalvariate(720, 220), 80, 1500), 2)
-        base["receiving_tds"] = round(clamp(rng.normalvariate(6, 3), 0, 18), 2)
-        base["receiving_yac"] = round(clamp(rng.normalvariate(260, 130), 0, 850), 2)
-        base["fumbles"] = round(clamp(rng.normalvariate(0.7, 0.9), 0, 7), 2)
-    elif pos in {"CB", "S", "SAF", "DB"}:
-        base["tackles"] = round(clamp(rng.normalvariate(70, 25), 10, 160), 2)
-        base["tackles_for_loss"] = round(clamp(rng.normalvariate(2, 2), 0, 10), 2)
-        base["sacks"] = round(clamp(rng.normalvariate(1.0, 1.2), 0, 8), 2)
-        base["def_interceptions"] = round(clamp(rng.normalvariate(2.5, 2.5), 0, 12), 2)
-        base["forced_fumbles"] = round(clamp(rng.normalvariate(1.0, 1.2), 0, 8), 2)
-        base["passes_defended"] = round(clamp(rng.normalvariate(11, 4), 0, 28), 2)
-    elif pos in {"LB", "ILB", "OLB", "MLB"}:
-        base["tackles"] = round(clamp(rng.normalvariate(105, 25), 20, 180), 2)
-        base["tackles_for_loss"] = round(clamp(rng.normalvariate(12, 6), 0, 30), 2)
-        base["sacks"] = round(clamp(rng.normalvariate(4, 3), 0, 20), 2)
-        base["forced_fumbles"] = round(clamp(rng.normalvariate(1.5, 1.2), 0, 8), 2)
-        base["def_interceptions"] = round(clamp(rng.normalvariate(1.2, 1.8), 0, 8), 2)
-        base["passes_defended"] = round(clamp(rng.normalvariate(5.0, 3.0), 0, 18), 2)
-    elif pos in {"DE", "DT", "NT", "DL"}:
-        base["tackles"] = round(clamp(rng.normalvariate(55, 15), 10, 120), 2)
-        base["tackles_for_loss"] = round(clamp(rng.normalvariate(10, 5), 0, 25), 2)
-        base["sacks"] = round(clamp(rng.normalvariate(6, 4), 0, 22), 2)
-        base["forced_fumbles"] = round(clamp(rng.normalvariate(1.0, 0.8), 0, 6), 2)
-        base["passes_defended"] = round(clamp(rng.normalvariate(2.0, 1.5), 0, 10), 2)
-    elif pos in {"K"}:
-        fga = int(round(clamp(rng.normalvariate(34, 6), 10, 55)))
+# Stat classes for `player_stats_batch`: raw position codes that share a stat profile.
+STAT_CLASS_POSITIONS: dict[str, tuple[str, ...]] = {
+    "QB": ("QB",),
+    "RB": ("RB", "FB"),
+    "WR": ("WR",),
+    "TE": ("TE",),
+    "DB": ("CB", "S", "SAF", "DB"),
+    "LB": ("LB", "ILB", "OLB", "MLB"),
+    "DL": ("DE", "DT", "NT", "DL"),
+    "K": ("K",),
+    "P": ("P",),
+}
+
+
+def player_stats_batch(positions: np.ndarray, rng: np.random.Generator) -> dict[str, np.ndarray]:
+    """Generate stat lines for a batch of players in one vectorized pass.
+
+    Returns one float array per stat key, aligned with `positions`. Keys stay sparse:
+    rows whose position does not produce a stat hold NaN, which becomes null in the
+    Parquet struct (UI filters treat key presence as stat availability).
+    """
+    n = len(positions)
+    codes = np.char.upper(np.asarray(positions, dtype=str))
+    out: dict[str, np.ndarray] = {}
+
+    def draw(mean: float, sd: float, lo: float, hi: object, size: int) -> np.ndarray:
+        return np.clip(rng.normal(mean, sd, size), lo, hi)
+
+    def put(key: str, mask: np.ndarray, values: np.ndarray) -> None:
+        column = out.get(key)
+        if column is None:
+            column = out[key] = np.full(n, np.nan)
+        column[mask] = values
+
+    out["games_played"] = rng.integers(8, 18, n).astype(np.float64)
+    out["snaps"] = rng.integers(150, 1151, n).astype(np.float64)
+    # Used in the Leaders panel across all categories.
+    out["wpa_total"] = np.round(draw(0.1, 0.65, -2.5, 3.5, n), 3)
+
+    masks = {cls: np.isin(codes, members) for cls, members in STAT_CLASS_POSITIONS.items()}
+
+    mask = masks["QB"]
+    k = int(mask.sum())
+    if k:
+        pass_att = draw(540, 90, 120, 760, k)
+        comp_pct = draw(0.655, 0.05, 0.45, 0.78, k)
+        completions = np.clip(pass_att * comp_pct + rng.normal(0, 8, k), 60, pass_att)
+        put("passing_attempts", mask, np.round(pass_att, 2))
+        put("passing_completions", mask, np.round(completions, 2))
+        put("passing_yards", mask, np.round(draw(3800, 750, 500, 6000, k), 2))
+        put("passing_tds", mask, np.round(draw(27, 8, 2, 55, k), 2))
+        put("interceptions", mask, np.round(draw(11, 5, 0, 30, k), 2))
+        put("qbr", mask, np.round(draw(62, 12, 10, 98, k), 1))
+        put("rushing_yards", mask, np.round(draw(220, 200, 0, 1200, k), 2))
+        put("rushing_attempts", mask, np.round(draw(45, 25, 0, 170, k), 2))
+        put("rushing_tds", mask, np.round(draw(3, 2, 0, 12, k), 2))
+        put("fumbles", mask, np.round(draw(4, 2.5, 0, 14, k), 2))
+        put("rush_20_plus", mask, np.round(draw(2.0, 2.0, 0, 12, k), 2))
+
+    mask = masks["RB"]
+    k = int(mask.sum())
+    if k:
+        put("rushing_attempts", mask, np.round(draw(215, 70, 10, 380, k), 2))
+        put("rushing_yards", mask, np.round(draw(980, 320, 50, 2000, k), 2))
+        put("rushing_tds", mask, np.round(draw(8, 4, 0, 25, k), 2))
+        put("fumbles", mask, np.round(draw(2.5, 1.8, 0, 12, k), 2))
+        put("rush_20_plus", mask, np.round(draw(5.5, 3.5, 0, 25, k), 2))
+        targets = draw(55, 25, 0, 120, k)
+        catches = np.clip(targets * draw(0.72, 0.08, 0.45, 0.9, k), 0, targets)
+        put("receiving_targets", mask, np.round(targets, 2))
+        put("receptions", mask, np.round(catches, 2))
+        put("receiving_yards", mask, np.round(draw(310, 180, 0, 900, k), 2))
+        put("receiving_tds", mask, np.round(draw(2, 2, 0, 10, k), 2))
+        put("receiving_yac", mask, np.round(draw(220, 120, 0, 650, k), 2))
+
+    mask = masks["WR"]
+    k = int(mask.sum())
+    if k:
+        targets = draw(125, 35, 15, 210, k)
+        catch_pct = draw(0.66, 0.07, 0.4, 0.85, k)
+        catches = np.clip(targets * catch_pct + rng.normal(0, 5, k), 5, targets)
+        put("receiving_targets", mask, np.round(targets, 2))
+        put("receptions", mask, np.round(catches, 2))
+        put("receiving_yards", mask, np.round(draw(1050, 350, 100, 2200, k), 2))
+        put("receiving_tds", mask, np.round(draw(7, 3, 0, 20, k), 2))
+        put("receiving_yac", mask, np.round(draw(420, 170, 0, 1100, k), 2))
+        put("fumbles", mask, np.round(draw(1.2, 1.2, 0, 10, k), 2))
+
+    mask = masks["TE"]
+    k = int(mask.sum())
+    if k:
+        targets = draw(92, 25, 10, 160, k)
+        catch_pct = draw(0.69, 0.06, 0.45, 0.88, k)
+        catches = np.clip(targets * catch_pct + rng.normal(0, 4, k), 5, targets)
+        put("receiving_targets", mask, np.round(targets, 2))
+        put("receptions", mask, np.round(catches, 2))
+        put("receiving_yards", mask, np.round(draw(720, 220, 80, 1500, k), 2))
+        put("receiving_tds", mask, np.round(draw(6, 3, 0, 18, k), 2))
+        put("receiving_yac", mask, np.round(draw(260, 130, 0, 850, k), 2))
+        put("fumbles", mask, np.round(draw(0.7, 0.9, 0, 7, k), 2))
+
+    mask = masks["DB"]
+    k = int(mask.sum())
+    if k:
+        put("tackles", mask, np.round(draw(70, 25, 10, 160, k), 2))
+        put("tackles_for_loss", mask, np.round(draw(2, 2, 0, 10, k), 2))
+        put("sacks", mask, np.round(draw(1.0, 1.2, 0, 8, k), 2))
+        put("def_interceptions", mask, np.round(draw(2.5, 2.5, 0, 12, k), 2))
+        put("forced_fumbles", mask, np.round(draw(1.0, 1.2, 0, 8, k), 2))
+        put("passes_defended", mask, np.round(draw(11, 4, 0, 28, k), 2))
+
+    mask = masks["LB"]
+    k = int(mask.sum())
+    if k:
+        put("tackles", mask, np.round(draw(105, 25, 20, 180, k), 2))
+        put("tackles_for_loss", mask, np.round(draw(12, 6, 0, 30, k), 2))
+        put("sacks", mask, np.round(draw(4, 3, 0, 20, k), 2))
+        put("forced_fumbles", mask, np.round(draw(1.5, 1.2, 0, 8, k), 2))
+        put("def_interceptions", mask, np.round(draw(1.2, 1.8, 0, 8, k), 2))
+        put("passes_defended", mask, np.round(draw(5.0, 3.0, 0, 18, k), 2))
+
+    mask = masks["DL"]
+    k = int(mask.sum())
+    if k:
+        put("tackles", mask, np.round(draw(55, 15, 10, 120, k), 2))
+        put("tackles_for_loss", mask, np.round(draw(10, 5, 0, 25, k), 2))
+        put("sacks", mask, np.round(draw(6, 4, 0, 22, k), 2))
+        put("forced_fumbles", mask, np.round(draw(1.0, 0.8, 0, 6, k), 2))
+        put("passes_defended", mask, np.round(draw(2.0, 1.5, 0, 10, k), 2))
+
+    mask = masks["K"]
+    k = int(mask.sum())
+    if k:
+        fga = np.rint(draw(34, 6, 10, 55, k))
         # Simple breakdown; keep sums consistent with made/attempted.
-        made_rate = clamp(rng.normalvariate(0.83, 0.07), 0.55, 0.98)
-        fgm = int(round(clamp(fga * made_rate, 0, fga)))
-
-        under_29 = int(round(clamp(rng.normalvariate(10, 3), 0, fgm)))
-        remaining = max(0, fgm - under_29)
-        from_30_39 = int(round(clamp(rng.normalvariate(8, 3), 0, remaining)))
-        remaining = max(0, remaining - from_30_39)
-        from_40_49 = int(round(clamp(rng.normalvariate(7, 3), 0, remaining)))
-        remaining = max(0, remaining - from_40_49)
-        from_50_plus = remaining
-
-        base["field_goals_attempted"] = float(fga)
-        base["field_goals_made"] = float(fgm)
-        base["fg_made_under_29"] = float(under_29)
-        base["fg_made_30_39"] = float(from_30_39)
-        base["fg_made_40_49"] = float(from_40_49)
-        base["fg_made_50_plus"] = float(from_50_plus)
-    elif pos in {"P"}:
-        punts = clamp(rng.normalvariate(70, 15), 30, 120)
-        base["punts"] = round(punts, 2)
-        base["punt_yards"] = round(punts * clamp(rng.normalvariate(45, 3), 35, 55), 2)
-
-    return base
-
-
-def group_names_by_position(
-    names: Iterable[PlayerIdentity],
-) -> dict[str, list[PlayerIdentity]]:
-    grouped: dict[str, list[PlayerIdentity]] = {}
-    for identity in names:
-        grouped.setdefault(identity.position_group, []).append(identity)
-    return grouped
+        made_rate = draw(0.83, 0.07, 0.55, 0.98, k)
+        fgm = np.rint(np.clip(fga * made_rate, 0, fga))
+        under_29 = np.rint(draw(10, 3, 0, fgm, k))
+        remaining = np.maximum(0, fgm - under_29)
+        from_30_39 = np.rint(draw(8, 3, 0, remaining, k))
+        remaining = np.maximum(0, remaining - from_30_39)
+        from_40_49 = np.rint(draw(7, 3, 0, remaining, k))
+        from_50_plus = np.maximum(0, remaining - from_40_49)
+        put("field_goals_attempted", mask, fga)
+        put("field_goals_made", mask, fgm)
+        put("fg_made_under_29", mask, under_29)
+        put("fg_made_30_39", mask, from_30_39)
+        put("fg_made_40_49", mask, from_40_49)
+        put("fg_made_50_plus", mask, from_50_plus)
+
+    mask = masks["P"]
+    k = int(mask.sum())
+    if k:
+        punts = draw(70, 15, 30, 120, k)
+        put("punts", mask, np.round(punts, 2))
+        put("punt_yards", mask, np.round(punts * draw(45, 3, 35, 55, k), 2))
+
+    return out
+
+
+def group_names_by_position(pool: IdentityPool) -> dict[str, np.ndarray]:
+    """Pool indices for each position group, in pool order."""
+    return {
+        str(group): np.flatnonzero(pool.position_groups == group)
+        for group in np.unique(pool.position_groups)
+    }
 
 
-def build_roster(
-    grouped_names: dict[str, list[PlayerIdentity]],
-    fallback_pool: Sequence[PlayerIdentity],
-    rng: random.Random,
+def resolve_roster_pools(
+    grouped_names: dict[str, np.ndarray],
+    pool_size: int,
     roster_template: dict[str, int],
-) -> list[PlayerIdentity]:
-    roster: list[PlayerIdentity] = []
+) -> list[tuple[np.ndarray, int]]:
+    """Pair each template slot count with its candidate indices, resolved once per run."""
+    fallback = np.arange(pool_size)
+    pools: list[tuple[np.ndarray, int]] = []
     for group, count in roster_template.items():
-        candidates = grouped_names.get(group) or fallback_pool
-        if not candidates:
-            continue
-        if len(candidates) >= count:
-            roster.extend(rng.sample(candidates, count))
-        else:
-            roster.extend(rng.choices(candidates, k=count))
+        candidates = grouped_names.get(group, fallback)
+        if len(candidates):
+            pools.append((candidates, count))
+    return pools
+
+
+def build_roster(
+    roster_pools: Sequence[tuple[np.ndarray, int]],
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Sample one roster and return it as shuffled indices into the identity pool."""
+    picks: list[np.ndarray] = []
+    for candidates, count in roster_pools:
+        # Sample without replacement when the pool is deep enough.
+        size = len(candidates)
+        picks.append(candidates[rng.choice(size, size=count, replace=size < count)])
+    roster = np.concatenate(picks)
     rng.shuffle(roster)
     return roster
 
@@ -591,97 +777,138 @@ def generate_players(
     seasons: Sequence[int],
     roster_template: dict[str, int],
     team_catalog: Sequence[tuple[str, str]],
-    names: list[PlayerIdentity],
-    rng: random.Random,
+    identities: IdentityPool,
+    rng: np.random.Generator,
     schema_version: str,
     progress: Progress,
     task_id: int,
-) -> tuple[pl.DataFrame, dict[tuple[int, str], list[float]]]:
-    grouped = group_names_by_position(names)
-    team_overall: dict[tuple[int, str], list[float]] = {}
-    records: list[dict[str, object]] = []
-    today = date.today()
-    for season in seasons:
-        for abbr, team_name in team_catalog:
-            roster = build_roster(grouped, names, rng, roster_template)
-            for slot, identity in enumerate(roster):
-                rating = ratings_block(rng)
-                stats = player_stats(identity.position, rng)
-                record = {
-                    "id": stable_id("player", identity.name, str(season), abbr, str(slot)),
-                    "name": identity.name,
-                    "entity_type": "player",
-                    "position": identity.position,
-                    "team": abbr,
-                    "era": str(season),
-                    "ratings": rating,
-                    "stats": stats,
-                    "schema_version": schema_version,
-                    "source": "synthetic:nflreadpy-names",
-                    "updated_at": today,
-                    "team_name": team_name,
-                    "season": season,
-                }
-                records.append(record)
-                team_overall.setdefault((season, abbr), []).append(rating["overall"])
-            progress.advance(task_id)
-    return pl.from_dicts(records), team_overall
+) -> tuple[pl.LazyFrame, np.ndarray]:
+    roster_pools = resolve_roster_pools(
+        group_names_by_position(identities), len(identities), roster_template
+    )
+    # Every roster has the same size, so all outputs are preallocated and filled by
+    # (season, team) row; only the id hash needs a per-player Python call.
+    roster_size = sum(count for _, count in roster_pools)
+    rosters = np.empty((len(seasons) * len(team_catalog), roster_size), dtype=np.intp)
+    ids = np.empty(rosters.size, dtype=object)
+    pairs = list(itertools.product(seasons, team_catalog))
+    for row, (season, (abbr, _)) in enumerate(pairs):
+        rosters[row] = build_roster(roster_pools, rng)
+        start = row * roster_size
+        ids[start : start + roster_size] = [
+            stable_id("player", name, str(season), abbr, str(slot))
+            for slot, name in enumerate(identities.names[rosters[row]].tolist())
+        ]
+        progress.advance(task_id)
+    teams = np.array([abbr for _, (abbr, _) in pairs]).repeat(roster_size)
+    team_names = np.array([team_name for _, (_, team_name) in pairs]).repeat(roster_size)
+    player_seasons = np.array([season for season, _ in pairs]).repeat(roster_size)
+
+    # Ratings and stats are sampled for every player at once; NaN marks stat keys a
+    # position never produces. Values carry at most a few decimals, so they are stored
+    # as Float32.
+    picked = rosters.ravel()
+    positions = identities.positions[picked]
+    count = len(ids)
+    ratings = pl.DataFrame(ratings_batch(rng.normal(70, 8, count), rng))
+    stats = pl.DataFrame(player_stats_batch(positions, rng)).fill_nan(None).cast(pl.Float32)
+    stats_col = stats.to_struct("stats")
+    players_schema = {
+        "id": pl.Utf8,
+        "name": pl.Utf8,
+        "entity_type": pl.Utf8,
+        "position": pl.Utf8,
+        "team": pl.Utf8,
+        "era": pl.Utf8,
+        "ratings": RATINGS_DTYPE,
+        "stats": stats_col.dtype,
+        "schema_version": pl.Utf8,
+        "source": pl.Utf8,
+        "updated_at": pl.Date,
+        "team_name": pl.Utf8,
+        "season": pl.Int64,
+    }
+    players_df = pl.DataFrame(
+        {
+            "id": ids,
+            "name": identities.names[picked],
+            "entity_type": ["player"] * count,
+            "position": positions,
+            "team": teams,
+            "era": player_seasons.astype(str),
+            "ratings": ratings.to_struct("ratings"),
+            "stats": stats_col,
+            "schema_version": [schema_version] * count,
+            "source": ["synthetic:nflreadpy-names"] * count,
+            "updated_at": [date.today()] * count,
+            "team_name": team_names,
+            "season": player_seasons,
+        },
+        schema=players_schema,
+    )
+    # Rosters are contiguous rows per (season, team) pair, so team means are a reshape.
+    overall = ratings.get_column("overall").to_numpy()
+    team_overall = overall.reshape(len(pairs), roster_size).mean(axis=1)
+    return players_df.lazy(), team_overall
 
 
 def generate_teams(
     *,
     seasons: Sequence[int],
     team_catalog: Sequence[tuple[str, str]],
-    team_overall: dict[tuple[int, str], list[float]],
-    rng: random.Random,
+    team_overall: np.ndarray,
+    rng: np.random.Generator,
     schema_version: str,
-) -> tuple[pl.DataFrame, dict[tuple[int, str], dict[str, float]]]:
-    records: list[dict[str, object]] = []
-    summary: dict[tuple[int, str], dict[str, float]] = {}
-    today = date.today()
-    for season in seasons:
-        for abbr, team_name in team_catalog:
-            ratings_list = team_overall.get((season, abbr), [])
-            base_overall = sum(ratings_list) / len(ratings_list) if ratings_list else rng.uniform(60, 82)
-            rating = ratings_block(rng, base=base_overall)
-            wins = clamp(rating["overall"] / 6.5 + rng.normalvariate(-2, 2.5), 0, 17)
-            wins_int = int(round(wins))
-            losses_int = max(0, 17 - wins_int)
-            points_for = int(clamp(rng.normalvariate(320 + (rating["overall"] - 65) * 6, 45), 180, 620))
-            points_against = int(clamp(rng.normalvariate(330 - (rating["overall"] - 65) * 5, 45), 180, 620))
-            stats = {
-                "wins": wins_int,
-                "losses": losses_int,
-                "points_for": points_for,
-                "points_against": points_against,
-                "epa_per_play": round(rng.normalvariate((rating["overall"] - 70) / 100, 0.05), 3),
-                "success_rate": round(clamp(rng.normalvariate(0.46, 0.05), 0.3, 0.6), 3),
-                "turnover_diff": round(rng.normalvariate((rating["overall"] - 70) / 20, 3), 1),
-                "playoff_prob": round(clamp((rating["overall"] - 60) / 50, 0, 1), 3),
-            }
-            record = {
-                "id": stable_id("team", abbr, str(season)),
-                "name": team_name,
-                "entity_type": "team",
-                "era": str(season),
-                "ratings": rating,
-                "stats": stats,
-                "schema_version": schema_version,
-                "source": "synthetic:aggregate",
-                "updated_at": today,
-                "team": abbr,
-                "season": season,
-                "logo_url": None,
-                "logo_path": None,
-            }
-            summary[(season, abbr)] = {
-                "overall": rating["overall"],
-                "wins": wins_int,
-                "losses": losses_int,
-                "playoff_prob": stats["playoff_prob"],
-            }
-            records.append(record)
-    return pl.from_dicts(records), summary
+) -> tuple[pl.LazyFrame, dict[tuple[int, str], dict[str, float]]]:
+    pairs = list(itertools.product(seasons, team_catalog))
+    count = len(pairs)
+    # Mean roster overall per (season, team) pair, aligned with `pairs`; NaN if unknown.
+    base_overall = np.array(team_overall, dtype=float)
+    missing = np.isnan(base_overall)
+    base_overall[missing] = rng.uniform(60, 82, int(missing.sum()))
+
+    # Facets stay flat until the final frame is built; the struct columns are packed once.
+    ratings = ratings_batch(base_overall, rng)
+    overall = ratings["overall"]
+    wins = np.rint(np.clip(overall / 6.5 + rng.normal(-2, 2.5, count), 0, 17)).astype(np.int64)
+    stats = {
+        "wins": wins,
+        "losses": np.maximum(0, 17 - wins),
+        "points_for": np.clip(rng.normal(320 + (overall - 65) * 6, 45), 180, 620).astype(np.int64),
+        "points_against": np.clip(rng.normal(330 - (overall - 65) * 5, 45), 180, 620).astype(np.int64),
+        "epa_per_play": np.round(rng.normal((overall - 70) / 100, 0.05), 3),
+        "success_rate": np.round(np.clip(rng.normal(0.46, 0.05, count), 0.3, 0.6), 3),
+        "turnover_diff": np.round(rng.normal((overall - 70) / 20, 3), 1),
+        "playoff_prob": np.round(np.clip((overall - 60) / 50, 0, 1), 3),
+    }
+    frame = pl.DataFrame(
+        {
+            "id": [stable_id("team", abbr, str(season)) for season, (abbr, _) in pairs],
+            "name": [team_name for _, (_, team_name) in pairs],
+            "entity_type": ["team"] * count,
+            "era": [str(season) for season, _ in pairs],
+            "ratings": pl.DataFrame(ratings).to_struct("ratings"),
+            "stats": pl.DataFrame(stats).to_struct("stats"),
+            "schema_version": [schema_version] * count,
+            "source": ["synthetic:aggregate"] * count,
+            "updated_at": [date.today()] * count,
+            "team": [abbr for _, (abbr, _) in pairs],
+            "season": [season for season, _ in pairs],
+            "logo_url": [None] * count,
+            "logo_path": [None] * count,
+        },
+        schema=TEAMS_SCHEMA,
+    )
+    summary = {
+        (season, abbr): {
+            "overall": float(overall[index]),
+            "wins": int(stats["wins"][index]),
+            "losses": int(stats["losses"][index]),
+            "playoff_prob": float(stats["playoff_prob"][index]),
+        }
+        for index, (season, (abbr, _)) in enumerate(pairs)
+    }
+    return frame.lazy(), summary
 
 
 def generate_coaches(
@@ -689,38 +916,45 @@ def generate_coaches(
     seasons: Sequence[int],
     team_catalog: Sequence[tuple[str, str]],
     team_summary: dict[tuple[int, str], dict[str, float]],
-    rng: random.Random,
+    rng: np.random.Generator,
     schema_version: str,
-) -> pl.DataFrame:
-    records: list[dict[str, object]] = []
-    today = date.today()
-    for season in seasons:
-        for abbr, team_name in team_catalog:
-            summary = team_summary.get((season, abbr), {"overall": 70.0, "wins": 6, "losses": 11})
-            name = f"{rng.choice(COACH_FIRST_NAMES)} {rng.choice(COACH_LAST_NAMES)}"
-            rating = ratings_block(rng, base=summary["overall"] + rng.normalvariate(0, 3))
-            stats = {
-                "wins": summary["wins"],
-                "losses": summary["losses"],
-                "playoff_prob": round(summary.get("playoff_prob", 0.25), 3),
-                "tenure_years": round(rng.uniform(0.5, 6), 1),
-            }
-            record = {
-                "id": stable_id("coach", name, abbr, str(season)),
-                "name": name,
-                "entity_type": "coach",
-                "team": abbr,
-                "era": str(season),
-                "ratings": rating,
-                "stats": stats,
-                "schema_version": schema_version,
-                "source": "synthetic:coaches",
-                "updated_at": today,
-                "team_name": team_name,
-                "season": season,
-            }
-            records.append(record)
-    return pl.from_dicts(records)
+) -> pl.LazyFrame:
+    pairs = list(itertools.product(seasons, team_catalog))
+    count = len(pairs)
+    default = {"overall": 70.0, "wins": 6, "losses": 11}
+    summaries = [team_summary.get((season, abbr), default) for season, (abbr, _) in pairs]
+    first = np.array(COACH_FIRST_NAMES)[rng.integers(len(COACH_FIRST_NAMES), size=count)]
+    last = np.array(COACH_LAST_NAMES)[rng.integers(len(COACH_LAST_NAMES), size=count)]
+    names = [f"{first_name} {last_name}" for first_name, last_name in zip(first, last)]
+    overall = np.array([summary["overall"] for summary in summaries])
+    ratings = ratings_batch(overall + rng.normal(0, 3, count), rng)
+    stats = {
+        "wins": [summary["wins"] for summary in summaries],
+        "losses": [summary["losses"] for summary in summaries],
+        "playoff_prob": [round(summary.get("playoff_prob", 0.25), 3) for summary in summaries],
+        "tenure_years": np.round(rng.uniform(0.5, 6, count), 1),
+    }
+    frame = pl.DataFrame(
+        {
+            "id": [
+                stable_id("coach", name, abbr, str(season))
+                for name, (season, (abbr, _)) in zip(names, pairs)
+            ],
+            "name": names,
+            "entity_type": ["coach"] * count,
+            "team": [abbr for _, (abbr, _) in pairs],
+            "era": [str(season) for season, _ in pairs],
+            "ratings": pl.DataFrame(ratings).to_struct("ratings"),
+            "stats": pl.DataFrame(stats).to_struct("stats"),
+            "schema_version": [schema_version] * count,
+            "source": ["synthetic:coaches"] * count,
+            "updated_at": [date.today()] * count,
+            "team_name": [team_name for _, (_, team_name) in pairs],
+            "season": [season for season, _ in pairs],
+        },
+        schema=COACHES_SCHEMA,
+    )
+    return frame.lazy()
 
 
 def _first_sunday_of_september(year: int) -> date:
@@ -730,190 +964,189 @@ def _first_sunday_of_september(year: int) -> date:
     return seed
 
 
+def _weekly_slot_offsets(pair_count: int) -> np.ndarray:
+    """Kickoff offsets from the week's Sunday (midnight) for each pairing slot.
+
+    Slot 0 is Thursday night, the last slot Monday night, the second-to-last Sunday
+    night; the rest split between the early and late Sunday afternoon windows.
+    """
+    offsets: list[int] = []
+    mid_point = pair_count // 2
+    for i in range(pair_count):
+        if i == 0:
+            days, kickoff = -3, time(20, 15)  # Thursday 8:15 PM
+        elif i == pair_count - 1:
+            days, kickoff = 1, time(20, 15)  # Monday 8:15 PM
+        elif i == pair_count - 2:
+            days, kickoff = 0, time(20, 20)  # Sunday 8:20 PM
+        elif i < mid_point:
+            days, kickoff = 0, time(13, 0)  # Sunday 1:00 PM
+        else:
+            days, kickoff = 0, time(16, 25)  # Sunday 4:25 PM
+        offsets.append(days * 24 * 60 + kickoff.hour * 60 + kickoff.minute)
+    return np.array(offsets, dtype="timedelta64[m]")
+
+
+def _postseason_slot_offsets(game_count: int) -> np.ndarray:
+    """Kickoff offsets from the round's Sunday (midnight), spread Saturday through Monday."""
+    offsets: list[int] = []
+    for i in range(game_count):
+        if game_count == 1:
+            # Super Bowl: Sunday evening
+            days, kickoff = 0, time(18, 30)  # 6:30 PM
+        elif i == 0:
+            # First game: Saturday
+            days, kickoff = -1, time(16, 30)  # 4:30 PM
+        elif i == game_count - 1:
+            # Last game: Monday night (only for Wild Card weekend typically)
+            days, kickoff = 1, time(20, 15)  # 8:15 PM
+        elif i == game_count - 2:
+            # Second-to-last: Sunday night
+            days, kickoff = 0, time(20, 20)  # 8:20 PM
+        elif i % 2 == 1:
+            days, kickoff = 0, time(13, 0)  # 1:00 PM
+        else:
+            days, kickoff = 0, time(16, 25)  # 4:25 PM
+        offsets.append(days * 24 * 60 + kickoff.hour * 60 + kickoff.minute)
+    return np.array(offsets, dtype="timedelta64[m]")
+
+
+# Simple postseason bracket with placeholder matchups.
+POSTSEASON_ROUNDS: tuple[tuple[str, int], ...] = (
+    ("Wild Card", 6),
+    ("Divisional", 4),
+    ("Conference", 2),
+    ("Super Bowl", 1),
+)
+
+
 def generate_games(
     *,
     seasons: Sequence[int],
     team_catalog: Sequence[tuple[str, str]],
-    rng: random.Random,
+    rng: np.random.Generator,
     schema_version: str,
     weeks: int = 18,
-) -> pl.DataFrame:
-    records: list[dict[str, object]] = []
-    today = date.today()
-    kickoff_times = [time(13, 0), time(16, 25), time(20, 20)]
-    team_lookup = {abbr: name for abbr, name in team_catalog}
-
-    def weekly_pairings(teams: Sequence[str]) -> list[tuple[str, str]]:
-        pool = list(teams)
-        rng.shuffle(pool)
-        pairs = []
-        for idx in range(0, len(pool), 2):
-            if idx + 1 >= len(pool):
-                break
-            home, away = pool[idx], pool[idx + 1]
-            if rng.random() < 0.45:
-                home, away = away, home
-            pairs.append((home, away))
-        return pairs
+) -> pl.LazyFrame:
+    teams = np.array([abbr for abbr, _ in team_catalog])
+    stadiums = np.array([f"{name} Stadium" for _, name in team_catalog])
+    pair_count = len(teams) // 2
+    slot_offsets = _weekly_slot_offsets(pair_count)
+    postseason_offsets = {
+        round_name: _postseason_slot_offsets(game_count)
+        for round_name, game_count in POSTSEASON_ROUNDS
+    }
+    # Status and scores are derived once over the whole frame below.
+    base_schema = {name: dtype for name, dtype in GAMES_SCHEMA.items() if name != "status"}
+    frames: list[pl.DataFrame] = []
 
     for season in seasons:
-        base_sunday = _first_sunday_of_september(season)
-        teams = [abbr for abbr, _ in team_catalog]
-        for week in range(1, weeks + 1):
-            week_pairs = weekly_pairings(teams)
-            week_start_sunday = base_sunday + timedelta(days=7 * (week - 1))
-            
-            for i, (home, away) in enumerate(week_pairs):
-                # Determine game day and time based on position in week
-                if i == 0:
-                    # First game: Thursday
-                    start_date = week_start_sunday - timedelta(days=3)
-                    start_time_obj = time(20, 15)  # 8:15 PM
-                elif i == len(week_pairs) - 1:
-                    # Last game: Monday
-                    start_date = week_start_sunday + timedelta(days=1)
-                    start_time_obj = time(20, 15)  # 8:15 PM
-                elif i == len(week_pairs) - 2:
-                    # Second-to-last: Sunday night
-                    start_date = week_start_sunday
-                    start_time_obj = time(20, 20)  # 8:20 PM
-                else:
-                    # Sunday games: split between early and late afternoon
-                    start_date = week_start_sunday
-                    mid_point = len(week_pairs) // 2
-                    if i < mid_point:
-                        start_time_obj = time(13, 0)  # 1:00 PM
-                    else:
-                        start_time_obj = time(16, 25)  # 4:25 PM
-                
-                start_dt = datetime.combine(start_date, start_time_obj)
-                status = "final" if start_date <= today else "scheduled"
-                home_score = away_score = None
-                if status == "final":
-                    home_score = rng.randint(10, 42)
-                    away_score = rng.randint(10, 42)
+        base_sunday = np.datetime64(_first_sunday_of_september(season), "us")
+
+        # Regular season: every week shuffles the league and pairs neighbours, with a
+        # 45% chance of flipping home/away per pairing.
+        order = rng.permuted(np.tile(np.arange(len(teams)), (weeks, 1)), axis=1)
+        home = order[:, 0 : 2 * pair_count : 2]
+        away = order[:, 1 : 2 * pair_count : 2]
+        flip = rng.random(home.shape) < 0.45
+        home, away = np.where(flip, away, home).ravel(), np.where(flip, home, away).ravel()
+        week = np.repeat(np.arange(1, weeks + 1), pair_count)
+        count = len(week)
+        home_abbr, away_abbr = teams[home], teams[away]
+        frames.append(
+            pl.DataFrame(
+                {
+                    "id": [
+                        stable_id("game", str(season), f"wk{wk}", h, a)
+                        for wk, h, a in zip(week.tolist(), home_abbr.tolist(), away_abbr.tolist())
+                    ],
+                    "season": np.full(count, season),
+                    "week": week,
+                    "home_team": home_abbr,
+                    "away_team": away_abbr,
+                    "location": stadiums[home],
+                    "start_time": base_sunday
+                    + (week - 1) * np.timedelta64(7, "D")
+                    + np.tile(slot_offsets, weeks),
+                    "is_postseason": np.zeros(count, dtype=bool),
+                    "playoff_round": [None] * count,
                     # Slight tilt for home field.
-                    home_score = int(round(home_score + rng.normalvariate(1.5, 3)))
-                records.append(
-                    {
-                        "id": stable_id("game", str(season), f"wk{week}", home, away),
-                        "season": season,
-                        "week": week,
-                        "home_team": home,
-                        "away_team": away,
-                        "location": f"{team_lookup.get(home, home)} Stadium",
-                        "start_time": start_dt,
-                        "status": status,
-                        "is_postseason": False,
-                        "playoff_round": None,
-                        "home_score": home_score,
-                        "away_score": away_score,
-                        "schema_version": schema_version,
-                        "source": "synthetic:schedule",
-                    }
-                )
+                    "home_score": np.rint(rng.integers(10, 43, count) + rng.normal(1.5, 3, count)),
+                    "away_score": rng.integers(10, 43, count),
+                    "schema_version": [schema_version] * count,
+                    "source": ["synthetic:schedule"] * count,
+                },
+                schema=base_schema,
+            )
+        )
 
-        # Simple postseason bracket with placeholder matchups.
-        rounds: list[tuple[str, int]] = [
-            ("Wild Card", 6),
-            ("Divisional", 4),
-            ("Conference", 2),
-            ("Super Bowl", 1),
-        ]
+        columns: dict[str, list[object]] = {name: [] for name in base_schema}
         current_week = weeks
-        pool = list(teams)
-        for round_name, game_count in rounds:
+        for round_name, game_count in POSTSEASON_ROUNDS:
             current_week += 1
-            rng.shuffle(pool)
-            round_start_sunday = base_sunday + timedelta(days=7 * (current_week - 1))
-            
+            pool = rng.permutation(len(teams))
+            round_start_sunday = base_sunday + np.timedelta64(7 * (current_week - 1), "D")
+            kickoffs = (round_start_sunday + postseason_offsets[round_name]).tolist()
+
             for i in range(game_count):
-                if len(pool) < 2:
-                    pool = list(teams)
-                    rng.shuffle(pool)
-                home, away = pool[i % len(pool)], pool[(i + 1) % len(pool)]
-                
-                # Postseason: distribute across weekend (Saturday/Sunday/Monday)
-                if game_count == 1:
-                    # Super Bowl: Sunday evening
-                    start_date = round_start_sunday
-                    start_time_obj = time(18, 30)  # 6:30 PM
-                elif i == 0:
-                    # First game: Saturday
-                    start_date = round_start_sunday - timedelta(days=1)
-                    start_time_obj = time(16, 30)  # 4:30 PM
-                elif i == game_count - 1:
-                    # Last game: Monday night (only for Wild Card weekend typically)
-                    start_date = round_start_sunday + timedelta(days=1)
-                    start_time_obj = time(20, 15)  # 8:15 PM
-                elif i == game_count - 2:
-                    # Second-to-last: Sunday night
-                    start_date = round_start_sunday
-                    start_time_obj = time(20, 20)  # 8:20 PM
-                else:
-                    # Sunday afternoon games
-                    start_date = round_start_sunday
-                    if i % 2 == 1:
-                        start_time_obj = time(13, 0)  # 1:00 PM
-                    else:
-                        start_time_obj = time(16, 25)  # 4:25 PM
-                
-                start_dt = datetime.combine(start_date, start_time_obj)
-                status = "final" if start_date <= today else "scheduled"
-                home_score = away_score = None
-                if status == "final":
-                    home_score = rng.randint(13, 38)
-                    away_score = rng.randint(10, 34)
-                    home_score = int(round(home_score + rng.normalvariate(1.0, 2.5)))
-                records.append(
-                    {
-                        "id": stable_id("game", str(season), f"post-{round_name}-{i}", home, away),
-                        "season": season,
-                        "week": current_week,
-                        "home_team": home,
-                        "away_team": away,
-                        "location": f"{team_lookup.get(home, home)} Stadium",
-                        "start_time": start_dt,
-                        "status": status,
-                        "is_postseason": True,
-                        "playoff_round": round_name,
-                        "home_score": home_score,
-                        "away_score": away_score,
-                        "schema_version": schema_version,
-                        "source": "synthetic:schedule",
-                    }
+                home_idx, away_idx = pool[i % len(pool)], pool[(i + 1) % len(pool)]
+                append_row(
+                    columns,
+                    id=stable_id(
+                        "game", str(season), f"post-{round_name}-{i}",
+                        str(teams[home_idx]), str(teams[away_idx]),
+                    ),
+                    season=season,
+                    week=current_week,
+                    home_team=str(teams[home_idx]),
+                    away_team=str(teams[away_idx]),
+                    location=str(stadiums[home_idx]),
+                    start_time=kickoffs[i],
+                    is_postseason=True,
+                    playoff_round=round_name,
+                    home_score=int(round(rng.integers(13, 39) + rng.normal(1.0, 2.5))),
+                    away_score=int(rng.integers(10, 35)),
+                    schema_version=schema_version,
+                    source="synthetic:schedule",
                 )
-    games_schema = {
-        "id": pl.Utf8,
-        "season": pl.Int64,
-        "week": pl.Int64,
-        "home_team": pl.Utf8,
-        "away_team": pl.Utf8,
-        "location": pl.Utf8,
-        "start_time": pl.Datetime,
-        "status": pl.Utf8,
-        "is_postseason": pl.Boolean,
-        "playoff_round": pl.Utf8,
-        "home_score": pl.Int64,
-        "away_score": pl.Int64,
-        "schema_version": pl.Utf8,
-        "source": pl.Utf8,
-    }
-    return pl.from_dicts(records, schema=games_schema)
+        frames.append(pl.DataFrame(columns, schema=base_schema))
+
+    # Games on or before today are final; later games are scheduled and carry no score.
+    is_final = pl.col("start_time").dt.date() <= date.today()
+    return (
+        pl.concat(frames)
+        .lazy()
+        .with_columns(
+            pl.when(is_final).then(pl.lit("final")).otherwise(pl.lit("scheduled")).alias("status"),
+            pl.when(is_final).then(pl.col("home_score")).alias("home_score"),
+            pl.when(is_final).then(pl.col("away_score")).alias("away_score"),
+        )
+        .select(list(GAMES_SCHEMA))
+    )
 
 
-def write_parquet(df: pl.DataFrame, path: Path) -> Path:
+# Large enough that every synthetic table lands in a single row group.
+PARQUET_ROW_GROUP_SIZE = 262_144
+
+
+def write_parquet(frame: pl.LazyFrame, path: Path, *, compression_level: int = 1) -> Path:
     path.parent.mkdir(parents=True, exist_ok=True)
-    df.write_parquet(path, compression="zstd")
+    frame.sink_parquet(
+        path,
+        compression="zstd",
+        compression_level=compression_level,
+        row_group_size=PARQUET_ROW_GROUP_SIZE,
+    )
     return path
 
 
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
 def human_bytes(size: int) -> str:
-    for unit in ("B", "KB", "MB", "GB"):
-        if size < 1024:
-            return f"{size:.1f} {unit}"
-        size /= 1024
-    return f"{size:.1f} TB"
+    # bit_length is an exact integer log2; every 10 bits is one 1024x unit step.
+    index = min(len(BYTE_UNITS) - 1, max(0, (size.bit_length() - 1) // 10))
+    return f"{size / 1024**index:.1f} {BYTE_UNITS[index]}"
 
 
 def render_results(
@@ -923,40 +1156,46 @@ def render_results(
     teams_path: Path,
     coaches_path: Path,
     games_path: Path,
-    players_df: pl.DataFrame,
-    teams_df: pl.DataFrame,
-    coaches_df: pl.DataFrame,
-    games_df: pl.DataFrame,
+    players: pl.LazyFrame,
+    teams: pl.LazyFrame,
+    coaches: pl.LazyFrame,
+    games: pl.LazyFrame,
     seasons: Sequence[int],
 ) -> None:
+    # Only small aggregates are collected; the full frames are never materialized here.
+    overall = pl.col("ratings").struct.field("overall").mean().alias("overall")
+    player_agg = players.select(
+        pl.len().alias("rows"), overall, pl.col("position").n_unique().alias("positions")
+    ).collect()
+    team_agg = teams.select(pl.len().alias("rows"), overall).collect()
+    coach_agg = coaches.select(pl.len().alias("rows"), overall).collect()
+    games_rows = games.select(pl.len()).collect().item()
+
     size_table = Table(title="Data package sizes", expand=True)
     size_table.add_column("Dataset", justify="left", style="accent")
     size_table.add_column("Rows", justify="right")
     size_table.add_column("File size", justify="right")
-    for label, path, df in [
-        ("Players", players_path, players_df),
-        ("Teams", teams_path, teams_df),
-        ("Coaches", coaches_path, coaches_df),
-        ("Games", games_path, games_df),
+    for label, path, rows in [
+        ("Players", players_path, player_agg["rows"].item()),
+        ("Teams", teams_path, team_agg["rows"].item()),
+        ("Coaches", coaches_path, coach_agg["rows"].item()),
+        ("Games", games_path, games_rows),
     ]:
-        size_table.add_row(label, f"{len(df):,}", human_bytes(path.stat().st_size))
+        size_table.add_row(label, f"{rows:,}", human_bytes(path.stat().st_size))
 
-    player_overall = players_df.select(pl.col("ratings").struct.field("overall").mean()).item()
-    team_overall = teams_df.select(pl.col("ratings").struct.field("overall").mean()).item()
-    coach_overall = coaches_df.select(pl.col("ratings").struct.field("overall").mean()).item()
     stat_table = Table(title="Generated data statistics", expand=True)
     stat_table.add_column("Metric", style="accent")
     stat_table.add_column("Value", justify="right")
     stat_table.add_row("Seasons covered", f"{min(seasons)}-{max(seasons)}")
-    stat_table.add_row("Players per season (avg)", f"{len(players_df) // len(seasons):,}")
-    stat_table.add_row("Teams per season", f"{len(teams_df) // len(seasons):,}")
-    stat_table.add_row("Games per season", f"{len(games_df) // len(seasons):,}")
-    stat_table.add_row("Average player overall", f"{player_overall:.1f}")
-    stat_table.add_row("Average team overall", f"{team_overall:.1f}")
-    stat_table.add_row("Average coach overall", f"{coach_overall:.1f}")
     stat_table.add_row(
-        "Unique positions", str(players_df.select(pl.col("position").n_unique()).item())
+        "Players per season (avg)", f"{player_agg['rows'].item() // len(seasons):,}"
     )
+    stat_table.add_row("Teams per season", f"{team_agg['rows'].item() // len(seasons):,}")
+    stat_table.add_row("Games per season", f"{games_rows // len(seasons):,}")
+    stat_table.add_row("Average player overall", f"{player_agg['overall'].item():.1f}")
+    stat_table.add_row("Average team overall", f"{team_agg['overall'].item():.1f}")
+    stat_table.add_row("Average coach overall", f"{coach_agg['overall'].item():.1f}")
+    stat_table.add_row("Unique positions", str(player_agg["positions"].item()))
 
     console.print(size_table)
     console.print(stat_table)
@@ -965,7 +1204,7 @@ def render_results(
 def main() -> None:
     args = parse_args()
     console = build_console()
-    rng = random.Random(args.seed)
+    rng = np.random.default_rng(args.seed)
     seasons = list(range(args.start_year, args.end_year + 1))
     if not seasons:
         console.print("[error]No seasons resolved from the provided range.")
@@ -996,6 +1235,8 @@ def main() -> None:
         )
     )
 
+    nfl = import_nflreadpy(console)
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -1005,33 +1246,33 @@ def main() -> None:
         console=console,
     ) as progress:
         fetch_task = progress.add_task("Fetching player names via nflreadpy", total=None)
-        names = load_player_identities(
-            start_year=args.start_year, end_year=args.end_year, rng=rng, console=console
+        identities = load_player_identities(
+            nfl=nfl, start_year=args.start_year, end_year=args.end_year, rng=rng, console=console
         )
         progress.update(fetch_task, total=1, completed=1)
 
         gen_task = progress.add_task(
             "Generating player rosters and stats", total=len(seasons) * len(TEAM_CATALOG)
         )
-        players_df, team_overall = generate_players(
+        players_lf, team_overall = generate_players(
             seasons=seasons,
             roster_template=roster_template,
             team_catalog=TEAM_CATALOG,
-            names=names,
+            identities=identities,
             rng=rng,
             schema_version=schema_version,
             progress=progress,
             task_id=gen_task,
         )
 
-        team_df, team_summary = generate_teams(
+        teams_lf, team_summary = generate_teams(
             seasons=seasons,
             team_catalog=TEAM_CATALOG,
             team_overall=team_overall,
             rng=rng,
             schema_version=schema_version,
         )
-        coaches_df = generate_coaches(
+        coaches_lf = generate_coaches(
             seasons=seasons,
             team_catalog=TEAM_CATALOG,
             team_summary=team_summary,
@@ -1040,7 +1281,7 @@ def main() -> None:
         )
         games_task_total = len(seasons) * 18 * (len(TEAM_CATALOG) // 2)
         games_task = progress.add_task("Generating schedules", total=games_task_total)
-        games_df = generate_games(
+        games_lf = generate_games(
             seasons=seasons,
             team_catalog=TEAM_CATALOG,
             rng=rng,
@@ -1050,13 +1291,18 @@ def main() -> None:
         progress.update(games_task, completed=games_task_total)
 
         write_task = progress.add_task("Writing Parquet datasets", total=4)
-        players_path = write_parquet(players_df, output_root / "players.parquet")
+        level = args.compression_level
+        players_path = write_parquet(
+            players_lf, output_root / "players.parquet", compression_level=level
+        )
         progress.advance(write_task)
-        teams_path = write_parquet(team_df, output_root / "teams.parquet")
+        teams_path = write_parquet(teams_lf, output_root / "teams.parquet", compression_level=level)
         progress.advance(write_task)
-        coaches_path = write_parquet(coaches_df, output_root / "coaches.parquet")
+        coaches_path = write_parquet(
+            coaches_lf, output_root / "coaches.parquet", compression_level=level
+        )
         progress.advance(write_task)
-        games_path = write_parquet(games_df, output_root / "games.parquet")
+        games_path = write_parquet(games_lf, output_root / "games.parquet", compression_level=level)
         progress.advance(write_task)
 
     render_results(
@@ -1065,10 +1311,10 @@ def main() -> None:
         teams_path=teams_path,
         coaches_path=coaches_path,
         games_path=games_path,
-        players_df=players_df,
-        teams_df=team_df,
-        coaches_df=coaches_df,
-        games_df=games_df,
+        players=players_lf,
+        teams=teams_lf,
+        coaches=coaches_lf,
+        games=games_lf,
         seasons=seasons,
     )
     console.print(
@@ -9,6 +9,7 @@ Intended responsibilities:
 
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
@@ -20,12 +21,14 @@ if str(SRC_PATH) not in sys.path:
 
 import polars as pl
 from gridironlabs.core.config import AppPaths, load_config
+from gridironlabs.core.logging import configure_logging
 from gridironlabs.data.sources.nflreadpy_adapter import NFLReadPyAdapter
 
 
 def main() -> int:
     paths = AppPaths.from_env()
     config = load_config(paths)
+    logger = configure_logging(paths, config)
     
     # Respect the configured scraping flag (e.g., GRIDIRONLABS_ENABLE_SCRAPING).
     # If disabled, we skip remote pulls to keep the refresh script offline-friendly.
@@ -38,60 +41,76 @@ def main() -> int:
     # 1. Fetch Teams (and Logos)
     print("Fetching teams and logos...")
     try:
-        teams_list = list(nfl_source.fetch_teams())
-        print(f"fetched {len(teams_list)} teams")
+        # Consume the fetch in one pass, keeping only what is used below: every logo
+        # path (for verification) and the team -> logo mappings for the enrichment.
+        fetched = 0
+        logo_paths: list[str] = []
+        logo_path_by_team: dict[str, str] = {}
+        logo_url_by_team: dict[str, str | None] = {}
+        for t in nfl_source.fetch_teams():
+            fetched += 1
+            if t.logo_path:
+                logo_paths.append(t.logo_path)
+                if t.team:
+                    logo_path_by_team[t.team] = t.logo_path
+                    logo_url_by_team[t.team] = t.logo_url
+        print(f"fetched {fetched} teams")
         
-        # Verify logo paths exist
-        logo_count = sum(1 for t in teams_list if t.logo_path and Path(t.logo_path).exists())
-        print(f"Verified {logo_count} logos downloaded to {paths.data_external}/logos")
+        # Verify logo paths exist with one directory listing instead of a stat per team
+        logo_dir = paths.data_external / "logos"
+        existing_logos = {entry.name for entry in os.scandir(logo_dir)} if logo_dir.is_dir() else set()
+        logo_count = sum(1 for logo_path in logo_paths if Path(logo_path).name in existing_logos)
+        print(f"Verified {logo_count} logos downloaded to {logo_dir}")
 
         # 2. Enrich existing teams.parquet with logo paths
         teams_parquet = paths.data_processed / "teams.parquet"
         if teams_parquet.exists():
             print(f"Updating {teams_parquet} with logo paths...")
             
-            # Load existing synthetic data
-            df_existing = pl.read_parquet(teams_parquet)
+            # Scan existing synthetic data; the whole enrichment runs as one lazy plan
+            lf_existing = pl.scan_parquet(teams_parquet)
             
-            # Create a mapping DataFrame from fetched teams
-            # We only care about matching 'team' (abbr) -> 'logo_path', 'logo_url'
-            updates = []
-            for t in teams_list:
-                if t.team and t.logo_path:
-                    updates.append({
-                        "team": t.team,
-                        "new_logo_path": t.logo_path,
-                        "new_logo_url": t.logo_url
-                    })
-            
-            if updates:
-                df_updates = pl.from_dicts(updates)
-                
-                # Join updates on 'team' column
-                # We do a left join to preserve all existing rows (multiple seasons)
-                df_enriched = df_existing.join(df_updates, on="team", how="left")
-                
-                # Coalesce: use new_logo_path if present, else keep existing (which is null)
-                # Note: df_existing has 'logo_path' column which is all null.
-                # We replace 'logo_path' with 'new_logo_path' where available.
-                
-                df_final = df_enriched.with_columns([
-                    pl.col("new_logo_path").fill_null(pl.col("logo_path")).alias("logo_path"),
-                    pl.col("new_logo_url").fill_null(pl.col("logo_url")).alias("logo_url")
-                ]).drop(["new_logo_path", "new_logo_url"])
+            # Map fetched teams directly: 'team' (abbr) -> 'logo_path', 'logo_url'
+            if logo_path_by_team:
+                # A dict lookup over ~32 team codes replaces a hash join; every existing
+                # row (multiple seasons) is kept.
+                # Coalesce: use the fetched value if present, else keep existing (which is null)
+                # Note: lf_existing has 'logo_path' column which is all null.
+                team = pl.col("team")
+                merged = {
+                    "logo_path": pl.coalesce(
+                        team.replace_strict(logo_path_by_team, default=None, return_dtype=pl.Utf8),
+                        "logo_path",
+                    ),
+                    "logo_url": pl.coalesce(
+                        team.replace_strict(logo_url_by_team, default=None, return_dtype=pl.Utf8),
+                        "logo_url",
+                    ),
+                }
+                # Project the original column order directly so no drop is needed.
+                lf_final = lf_existing.select([
+                    merged[name].alias(name) if name in merged else pl.col(name)
+                    for name in lf_existing.collect_schema().names()
+                ])
                 
-                # Write back
-                df_final.write_parquet(teams_parquet, compression="zstd")
+                # Write back via a temp file: the plan is still reading teams_parquet
+                tmp_parquet = teams_parquet.with_suffix(".parquet.tmp")
+                # The teams table is small: one row group keeps a single zstd context per column.
+                lf_final.sink_parquet(
+                    tmp_parquet,
+                    compression="zstd",
+                    row_group_size=512 * 1024,
+                    data_page_size=1024 * 1024,
+                )
+                tmp_parquet.replace(teams_parquet)
                 print("Successfully updated teams.parquet with logos.")
             else:
                 print("No updates to apply.")
         else:
             print(f"Warning: {teams_parquet} not found. Run generate_fake_nfl_data.py first.")
         
-    except Exception as e:
-        print(f"Error fetching teams: {e}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Error fetching teams")
         return 1
         
     print("\nData refresh (partial) complete.")
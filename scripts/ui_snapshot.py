@@ -50,7 +50,7 @@ def main() -> int:
     args = parse_args()
 
     from PySide6.QtGui import QFont
-    from PySide6.QtWidgets import QApplication
+    from PySide6.QtWidgets import QAbstractScrollArea, QApplication
 
     from gridironlabs.core.config import AppPaths, load_config
     from gridironlabs.core.logging import configure_logging
@@ -88,15 +88,19 @@ def main() -> int:
     # Keep font consistent with the real app.
     app.setFont(QFont("Roboto Condensed"))
 
-    # Load the same stylesheet as the real app would.
-    from gridironlabs import resources as package_resources
+    # Load the same stylesheet as the real app would. Discovery modes only print
+    # objectNames and grid-driven geometry (identical with or without QSS), so they
+    # skip the read and the style polish.
+    discovery = args.list_pages or args.list_panels
+    if not discovery:
+        from gridironlabs import resources as package_resources
 
-    try:
-        stylesheet = package_resources.read_text("theme.qss", encoding="utf-8")
-    except Exception:
-        stylesheet = ""
-    if stylesheet:
-        app.setStyleSheet(stylesheet)
+        try:
+            stylesheet = package_resources.read_text("theme.qss", encoding="utf-8")
+        except Exception:
+            stylesheet = ""
+        if stylesheet:
+            app.setStyleSheet(stylesheet)
 
     window = GridironLabsMainWindow(config=config, paths=paths, logger=logger)
     window.show()
@@ -179,6 +183,8 @@ def main() -> int:
         host.setCentralWidget(container)
 
         settle = wait_for_stable_geometry(panel)
+        # One subtree walk, shared by the diagnostics and the full-content capture.
+        scroll_areas = panel.findChildren(QAbstractScrollArea)
         host_pm = grab_window_pixmap(host)
         rects = compute_target_rects(host, panel, pixmap=host_pm)
         crop_pm = crop_pixmap_dpi_correct(host_pm, rect_px=_rect_from_dict(rects["rect_px"]))
@@ -206,14 +212,12 @@ def main() -> int:
                 "target_rects": rects,
             },
             "tree": widget_tree(panel),
-            "scrollAreas": scroll_diagnostics(panel),
+            "scrollAreas": scroll_diagnostics(panel, areas=scroll_areas),
         }
 
         if args.full_content:
             fulls: list[dict[str, Any]] = []
-            from PySide6.QtWidgets import QAbstractScrollArea
-
-            for area in panel.findChildren(QAbstractScrollArea):
+            for area in scroll_areas:
                 pm, meta = render_full_content_for_scroll_area(area)
                 entry = {"objectName": area.objectName(), "class": type(area).__name__, "meta": meta}
                 if pm is not None and meta.get("supported"):
@@ -245,6 +249,8 @@ def main() -> int:
         target = target_widget
 
     settle = wait_for_stable_geometry(target)
+    # One subtree walk, shared by the diagnostics and the full-content capture.
+    scroll_areas = target.findChildren(QAbstractScrollArea)
     window_pm = grab_window_pixmap(window)
     rects = compute_target_rects(window, target, pixmap=window_pm)
     crop_pm = crop_pixmap_dpi_correct(window_pm, rect_px=_rect_from_dict(rects["rect_px"]))
@@ -271,15 +277,13 @@ def main() -> int:
             "target_rects": rects,
         },
         "tree": widget_tree(target),
-        "scrollAreas": scroll_diagnostics(target),
+        "scrollAreas": scroll_diagnostics(target, areas=scroll_areas),
     }
 
     # Optional full-content capture (v1: QScrollArea only).
     if args.full_content:
         fulls: list[dict[str, Any]] = []
-        from PySide6.QtWidgets import QAbstractScrollArea
-
-        for area in target.findChildren(QAbstractScrollArea):
+        for area in scroll_areas:
             pm, meta = render_full_content_for_scroll_area(area)
             entry = {"objectName": area.objectName(), "class": type(area).__name__, "meta": meta}
             if pm is not None and meta.get("supported"):
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Mapping
 
@@ -13,10 +14,13 @@ except ImportError:  # pragma: no cover - guard for environments without python-
     load_dotenv = None
 
 
+_TRUTHY: frozenset[str] = frozenset({"1", "true", "yes", "on"})
+
+
 def _as_bool(value: str | None, *, default: bool = False) -> bool:
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
 @dataclass(frozen=True)
@@ -55,7 +59,9 @@ class AppPaths:
             self.cache,
             self.logs,
         ):
-            path.mkdir(parents=True, exist_ok=True)
+            # One stat on warm runs; mkdir(exist_ok=True) costs a failed mkdir plus a stat.
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass(frozen=True)
@@ -88,14 +94,21 @@ class AppConfig:
         )
 
 
+@lru_cache(maxsize=8)
+def _load_env_file(env_path: Path) -> None:
+    """Read a .env file into the environment at most once per process and path."""
+    if env_path.exists():
+        load_dotenv(env_path)
+
+
 def load_config(paths: AppPaths, env_file: str | None = ".env") -> AppConfig:
     """Load configuration from environment and optional .env file."""
     if env_file and load_dotenv:
         env_path = Path(env_file)
         if not env_path.is_absolute():
             env_path = paths.root / env_file
-        if env_path.exists():
-            load_dotenv(env_path)
+        _load_env_file(env_path)
+    # Built outside the cache so env changes made during the process still apply.
     config = AppConfig.from_env(paths)
     paths.ensure_directories()
     return config
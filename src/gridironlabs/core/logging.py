@@ -21,6 +21,12 @@ class LogContext:
         return {k: v for k, v in asdict(self).items() if v is not None}
 
 
+# Attributes every LogRecord carries; anything else on a record came from `extra=`.
+_RESERVED_RECORD_KEYS: frozenset[str] = frozenset(
+    logging.LogRecord("", logging.NOTSET, "", 0, "", (), None).__dict__
+) | {"message", "asctime"}
+
+
 class JsonFormatter(logging.Formatter):
     """Lightweight JSON formatter without extra dependencies."""
 
@@ -34,9 +40,14 @@ class JsonFormatter(logging.Formatter):
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
         payload.update(
-            {k: v for k, v in record.__dict__.items() if k not in logging.LogRecord.__dict__}
+            {
+                k: v
+                for k, v in record.__dict__.items()
+                if k not in _RESERVED_RECORD_KEYS and k not in payload
+            }
         )
-        return json.dumps(payload)
+        # Extras are arbitrary objects; never let one break the log line.
+        return json.dumps(payload, default=str)
 
 
 def configure_logging(paths: AppPaths, config: AppConfig) -> logging.Logger:
@@ -7,7 +7,7 @@ from datetime import date, datetime
 from typing import Any, Literal, Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RatingBreakdown:
     overall: float | None = None
     athleticism: float | None = None
@@ -16,7 +16,7 @@ class RatingBreakdown:
     potential: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntitySummary:
     id: str
     name: str
@@ -33,7 +33,7 @@ class EntitySummary:
     logo_path: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComparisonView:
     """Captures a set of summaries to visualize side-by-side."""
 
@@ -42,7 +42,7 @@ class ComparisonView:
     advanced_metrics_enabled: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SearchResult:
     """Represents a lightweight search hit for navigation."""
 
@@ -53,7 +53,7 @@ class SearchResult:
     context: Mapping[str, str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameSummary:
     """Scheduled or completed game metadata."""
 
@@ -71,7 +71,7 @@ class GameSummary:
     playoff_round: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EntityRef:
     """Canonical reference to a player/team/coach entity for navigation."""
 
@@ -80,7 +80,7 @@ class EntityRef:
     season: int | None = None  # optional; future-proofing for multi-era data
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Route:
     """Internal navigation route (typed; history stores Route instances)."""
 
@@ -92,12 +92,14 @@ class Route:
 
 def route_to_string(route: Route) -> str:
     """Convert Route to a debug/log string (no parsing implemented in Phase 1)."""
-    if route.entity:
-        entity_str = f"{route.entity.entity_type}:{route.entity.id}"
-        if route.entity.season:
-            entity_str += f"@{route.entity.season}"
-        return f"Route({route.page}, {entity_str})"
-    if route.params:
-        params_str = ",".join(f"{k}={v}" for k, v in route.params.items())
+    entity = route.entity
+    if entity is not None:
+        if entity.season:
+            return f"Route({route.page}, {entity.entity_type}:{entity.id}@{entity.season})"
+        return f"Route({route.page}, {entity.entity_type}:{entity.id})"
+    params = route.params
+    if params:
+        # A list lets str.join size the result in one pass (a generator is listed first).
+        params_str = ",".join([f"{k}={v}" for k, v in params.items()])
         return f"Route({route.page}, params={params_str})"
     return f"Route({route.page})"
@@ -9,7 +9,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TeamInfo:
     abbr: str
     name: str
@@ -63,7 +63,9 @@ TEAM_INFO: tuple[TeamInfo, ...] = (
 
 
 TEAM_BY_ABBR: dict[str, TeamInfo] = {t.abbr: t for t in TEAM_INFO}
-TEAM_BY_NAME: dict[str, TeamInfo] = {t.name.lower(): t for t in TEAM_INFO}
+TEAM_BY_NAME: dict[str, TeamInfo] = {t.name.casefold(): t for t in TEAM_INFO}
+# Exact display names ("Kansas City Chiefs"), the common input from UI/data rows.
+_TEAM_BY_DISPLAY_NAME: dict[str, TeamInfo] = {t.name: t for t in TEAM_INFO}
 
 
 def normalize_team_abbr(raw: str | None) -> str | None:
@@ -74,6 +76,10 @@ def normalize_team_abbr(raw: str | None) -> str | None:
 
 
 def team_info_for_abbr(abbr: str | None) -> TeamInfo | None:
+    # Fast path: already-normalised abbreviations hit without any string work.
+    info = TEAM_BY_ABBR.get(abbr)  # type: ignore[arg-type]
+    if info is not None:
+        return info
     key = normalize_team_abbr(abbr)
     if not key:
         return None
@@ -81,9 +87,12 @@ def team_info_for_abbr(abbr: str | None) -> TeamInfo | None:
 
 
 def team_info_for_name(name: str | None) -> TeamInfo | None:
+    info = _TEAM_BY_DISPLAY_NAME.get(name)  # type: ignore[arg-type]
+    if info is not None:
+        return info
     if name is None:
         return None
-    key = str(name).strip().lower()
+    key = str(name).strip().casefold()
     if not key:
         return None
     return TEAM_BY_NAME.get(key)
@@ -103,13 +112,41 @@ def list_conferences() -> tuple[str, str]:
     return ("AFC", "NFC")
 
 
+def _build_filter_indexes() -> tuple[
+    dict[str | None, tuple[str, ...]],
+    dict[tuple[str | None, str | None], tuple[TeamInfo, ...]],
+]:
+    """Materialise every conference/division filter result once; TEAM_INFO is static."""
+    conferences: tuple[str | None, ...] = (None, *list_conferences())
+    divisions: tuple[str | None, ...] = (None, *sorted({t.division for t in TEAM_INFO}))
+
+    divisions_by_conf = {
+        conf: tuple(sorted({t.division for t in TEAM_INFO if conf is None or t.conference == conf}))
+        for conf in conferences
+    }
+    teams_by_filter = {
+        (conf, div): tuple(
+            sorted(
+                (
+                    t
+                    for t in TEAM_INFO
+                    if (conf is None or t.conference == conf) and (div is None or t.division == div)
+                ),
+                key=lambda t: t.name,
+            )
+        )
+        for conf in conferences
+        for div in divisions
+    }
+    return divisions_by_conf, teams_by_filter
+
+
+_DIVISIONS_BY_CONFERENCE, _TEAMS_BY_FILTER = _build_filter_indexes()
+
+
 def list_divisions(*, conference: str | None = None) -> list[str]:
-    if conference is None:
-        divs = {t.division for t in TEAM_INFO}
-    else:
-        conf = str(conference).strip().upper()
-        divs = {t.division for t in TEAM_INFO if t.conference == conf}
-    return sorted(divs)
+    conf = None if conference is None else str(conference).strip().upper()
+    return list(_DIVISIONS_BY_CONFERENCE.get(conf, ()))
 
 
 def list_teams(
@@ -117,13 +154,7 @@ def list_teams(
 ) -> list[TeamInfo]:
     conf = str(conference).strip().upper() if conference else None
     div = str(division).strip() if division else None
-
-    teams = list(TEAM_INFO)
-    if conf:
-        teams = [t for t in teams if t.conference == conf]
-    if div:
-        teams = [t for t in teams if t.division == div]
-    return sorted(teams, key=lambda t: t.name)
+    return list(_TEAMS_BY_FILTER.get((conf or None, div or None), ()))
 
 
 __all__ = [
@@ -7,9 +7,18 @@ normalizes common fields, and provides simple in-memory caching.
 
 from __future__ import annotations
 
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Protocol
+from typing import Any, Iterable, Iterator, Mapping, Protocol, Sequence, cast
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - optional dependency at runtime
+    pl = None  # type: ignore[assignment]
 
 from gridironlabs.core.errors import DataValidationError, MissingDependencyError, NotFoundError
 from gridironlabs.core.models import EntitySummary, GameSummary, RatingBreakdown
@@ -33,6 +42,184 @@ class SummaryRepository(Protocol):
 
     def get_coach(self, coach_id: str) -> EntitySummary: ...
 
+    def try_get_player(self, player_id: str) -> EntitySummary | None:
+        """Return the player, or None when the id is unknown."""
+        try:
+            return self.get_player(player_id)
+        except NotFoundError:
+            return None
+
+
+# Required columns when the registry has no schema for a table (entities need id/name).
+_DEFAULT_ENTITY_REQUIRED_COLUMNS: frozenset[str] = frozenset({"id", "name"})
+_DEFAULT_REQUIRED_COLUMNS: Mapping[str, frozenset[str]] = {
+    "games": frozenset({"id", "season", "week", "home_team", "away_team", "start_time", "status"}),
+}
+
+# Columns the loaders consume; reads project onto these so unused columns are never decoded.
+_ENTITY_COLUMNS: tuple[str, ...] = (
+    "id",
+    "name",
+    "entity_type",
+    "era",
+    "team",
+    "position",
+    "ratings",
+    "stats",
+    "schema_version",
+    "source",
+    "updated_at",
+    "logo_url",
+    "logo_path",
+)
+_GAME_COLUMNS: tuple[str, ...] = (
+    "id",
+    "season",
+    "week",
+    "home_team",
+    "away_team",
+    "location",
+    "start_time",
+    "status",
+    "is_postseason",
+    "home_score",
+    "away_score",
+    "playoff_round",
+)
+
+
+def _normalize_text(raw: object) -> str | None:
+    if raw is None:
+        return None
+    text = raw.strip() if type(raw) is str else str(raw).strip()
+    return text or None
+
+
+def _as_int(raw: object) -> int | None:
+    # Exact-type checks first: bool is an int subclass and must not take this path.
+    if type(raw) is int:
+        return raw
+    if raw is None:
+        return None
+    if isinstance(raw, bool):
+        return int(raw)
+    if isinstance(raw, int):
+        return raw
+    if isinstance(raw, float):
+        return int(raw)
+    try:
+        return int(str(raw).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_float(raw: object) -> float | None:
+    if type(raw) is float:
+        return raw
+    if raw is None:
+        return None
+    if isinstance(raw, bool):
+        return float(int(raw))
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    try:
+        return float(str(raw).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalize_date(raw: object) -> date | None:
+    if raw is None:
+        return None
+    if isinstance(raw, date) and not isinstance(raw, datetime):
+        return raw
+    if isinstance(raw, datetime):
+        return raw.date()
+    if isinstance(raw, str):
+        return _parse_date_text(raw)
+    return None
+
+
+def _normalize_datetime(raw: object) -> datetime | None:
+    if raw is None:
+        return None
+    if isinstance(raw, datetime):
+        return raw
+    if isinstance(raw, date):
+        return datetime.combine(raw, datetime.min.time())
+    if isinstance(raw, str):
+        return _parse_datetime_text(raw.strip())
+    return None
+
+
+# Date strings repeat heavily across rows (kickoff slots, update stamps); parse each once.
+@lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> date | None:
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime_text(text: str) -> datetime | None:
+    # Try strict ISO first.
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    # Lenient fallbacks (e.g. unpadded fields). At most one format can match, so pick it
+    # from the text instead of trying each: no time part, a "T" separator, or whitespace.
+    if ":" not in text:
+        fmt = "%Y-%m-%d"
+    elif "T" in text:
+        fmt = "%Y-%m-%dT%H:%M:%S"
+    else:
+        fmt = "%Y-%m-%d %H:%M:%S"
+    try:
+        return datetime.strptime(text, fmt)
+    except ValueError:
+        return None
+
+
+class _LazyStats(Mapping[str, float]):
+    """Read-only stats mapping over a raw struct row, coerced on first access.
+
+    Keys are stringified and entries whose value is not numeric are dropped, as
+    `_parse_stats` always did; rows whose stats are never read are never walked.
+    """
+
+    __slots__ = ("_raw", "_stats")
+
+    def __init__(self, raw: Mapping[Any, object]) -> None:
+        self._raw: Mapping[Any, object] | None = raw
+        self._stats: dict[str, float] | None = None
+
+    def _materialize(self) -> dict[str, float]:
+        stats = self._stats
+        if stats is None:
+            stats = {}
+            for key, value in (self._raw or {}).items():
+                if key is None:
+                    continue
+                number = _as_float(value)
+                if number is not None:
+                    stats[str(key)] = number
+            self._stats, self._raw = stats, None
+        return stats
+
+    def __getitem__(self, key: str) -> float:
+        return self._materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __repr__(self) -> str:
+        return repr(self._materialize())
+
 
 class ParquetSummaryRepository:
     """Parquet-backed implementation used by services and UI."""
@@ -48,191 +235,370 @@ class ParquetSummaryRepository:
         self.schema_version = str(schema_version).strip() or "v0"
         self.schema_registry = schema_registry
 
-        self._entity_cache: dict[str, list[EntitySummary]] = {}
+        self._entity_cache: dict[str, tuple[EntitySummary, ...]] = {}
         self._games_cache: list[GameSummary] | None = None
-        # O(1) id→index maps (rebuilt any time entity cache is loaded/reloaded)
-        self._players_by_id: dict[str, int] = {}
-        self._teams_by_id: dict[str, int] = {}
-        self._coaches_by_id: dict[str, int] = {}
+        # O(1) id→entity maps per table (built alongside the entity cache on each load)
+        self._id_index: dict[str, dict[str, EntitySummary]] = {}
+        self._required_cache: dict[tuple[str, str], frozenset[str]] = {}
+        # One lock per table so concurrent first access (e.g. prefetch_all) loads once.
+        self._load_locks: dict[str, threading.Lock] = {}
 
     def _path_for(self, name: str) -> Path:
         return self.root / f"{name}.parquet"
 
+    def _snapshot_path_for(self, name: str) -> Path:
+        return self.root / f"{name}.ipc"
+
+    def _stamp_path_for(self, name: str) -> Path:
+        return self.root / f"{name}.ipc.stamp"
+
+    def _source_stamp(self, path: Path) -> str:
+        """Identify the Parquet file and schema version a snapshot was built from."""
+        stat = path.stat()
+        return f"{stat.st_mtime_ns} {stat.st_size} {self.schema_version}"
+
     def _schema_for(self, name: str) -> SchemaVersion | None:
         key = f"{name}:{self.schema_version}"
         fallback_key = f"{name}:v0"
         return self.schema_registry.get(key) or self.schema_registry.get(fallback_key)
 
-    @staticmethod
-    def _normalize_text(raw: object) -> str | None:
-        if raw is None:
+    def _parse_ratings(
+        self,
+        raw: object,
+        *,
+        cache: dict[tuple[float | None, ...], RatingBreakdown] | None = None,
+    ) -> RatingBreakdown | None:
+        """Parse a ratings struct; rows with identical values share one instance via `cache`."""
+        if raw is None or not isinstance(raw, Mapping):
             return None
-        text = str(raw).strip()
-        return text or None
+        key = (
+            _as_float(raw.get("overall")),
+            _as_float(raw.get("athleticism")),
+            _as_float(raw.get("technical")),
+            _as_float(raw.get("intangibles")),
+            _as_float(raw.get("potential")),
+        )
+        if cache is None:
+            return RatingBreakdown(*key)
+        ratings = cache.get(key)
+        if ratings is None:
+            ratings = cache[key] = RatingBreakdown(*key)
+        return ratings
+
+    def _parse_stats(self, raw: object) -> Mapping[str, float] | None:
+        if not raw or not isinstance(raw, Mapping):
+            return None
+        return _LazyStats(raw)
+
+    def _required_columns(self, name: str) -> frozenset[str]:
+        key = (name, self.schema_version)
+        required = self._required_cache.get(key)
+        if required is None:
+            schema = self._schema_for(name)
+            if schema:
+                required = frozenset(schema.fields)
+            else:
+                required = _DEFAULT_REQUIRED_COLUMNS.get(name, _DEFAULT_ENTITY_REQUIRED_COLUMNS)
+            self._required_cache[key] = required
+        return required
 
     @staticmethod
-    def _as_int(raw: object) -> int | None:
-        if raw is None:
-            return None
-        if isinstance(raw, bool):
-            return int(raw)
-        if isinstance(raw, int):
-            return raw
-        if isinstance(raw, float):
-            return int(raw)
-        try:
-            return int(str(raw).strip())
-        except (TypeError, ValueError):
-            return None
+    def _check_required_columns(name: str, required: frozenset[str], df: Any) -> None:
+        present = set(getattr(df, "columns", ()))
+        if not required <= present:
+            missing = required - present
+            raise DataValidationError(
+                f"Table {name} is missing required columns: {', '.join(sorted(missing))}"
+            )
 
     @staticmethod
-    def _as_float(raw: object) -> float | None:
-        if raw is None:
-            return None
-        if isinstance(raw, bool):
-            return float(int(raw))
-        if isinstance(raw, (int, float)):
-            return float(raw)
+    def _require_polars() -> None:
+        if pl is None:  # pragma: no cover - optional dependency at runtime
+            raise MissingDependencyError("polars is required to load Parquet datasets")
+
+    def _read_parquet(self, *, name: str, columns: Sequence[str] | None = None) -> Any:
+        path = self._path_for(name)
+        if not path.exists():
+            raise NotFoundError(f"Parquet table {name} not found at {path}")
+
+        self._require_polars()
+
         try:
-            return float(str(raw).strip())
-        except (TypeError, ValueError):
-            return None
+            # Stamp before reading: a file swapped in mid-read leaves a stale stamp, not stale rows.
+            stamp = self._source_stamp(path)
+            available = pl.read_parquet_schema(path)
+            # Project onto the requested columns that exist; missing optional
+            # columns are left to the caller's validation.
+            wanted = list(available) if columns is None else [c for c in columns if c in available]
+            snapshot = self._read_snapshot(name=name, stamp=stamp, columns=wanted)
+            if snapshot is not None:
+                return snapshot
+            df = pl.read_parquet(path, columns=wanted)
+        except Exception as exc:  # pragma: no cover - surface IO errors
+            raise DataValidationError(f"Failed to read Parquet table {name}: {exc}") from exc
 
-    @staticmethod
-    def _normalize_date(raw: object) -> date | None:
-        if raw is None:
-            return None
-        if isinstance(raw, date) and not isinstance(raw, datetime):
-            return raw
-        if isinstance(raw, datetime):
-            return raw.date()
-        if isinstance(raw, str):
-            try:
-                return date.fromisoformat(raw)
-            except ValueError:
-                return None
-        return None
+        self._write_snapshot(df, name=name, stamp=stamp)
+        return df
 
-    @staticmethod
-    def _normalize_datetime(raw: object) -> datetime | None:
-        if raw is None:
-            return None
-        if isinstance(raw, datetime):
-            return raw
-        if isinstance(raw, date):
-            return datetime.combine(raw, datetime.min.time())
-        if isinstance(raw, str):
-            text = raw.strip()
-            # Try strict ISO first.
-            try:
-                return datetime.fromisoformat(text)
-            except ValueError:
-                pass
-            for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d"):
-                try:
-                    return datetime.strptime(text, fmt)
-                except ValueError:
-                    continue
-        return None
+    def _read_snapshot(self, *, name: str, stamp: str, columns: Sequence[str]) -> Any:
+        """Memory-map the Arrow IPC snapshot of a table if it is current, else return None.
 
-    def _parse_ratings(self, raw: object) -> RatingBreakdown | None:
-        if raw is None or not isinstance(raw, Mapping):
+        A snapshot is current when its stamp file matches the Parquet file's `stamp`
+        exactly and it holds every requested column; anything unreadable falls back
+        to Parquet.
+        """
+        snapshot_path = self._snapshot_path_for(name)
+        try:
+            if self._stamp_path_for(name).read_text(encoding="utf-8") != stamp:
+                return None
+            if not set(columns).issubset(pl.read_ipc_schema(snapshot_path)):
+                return None
+            return pl.read_ipc(snapshot_path, columns=list(columns))
+        except (OSError, pl.exceptions.PolarsError):
             return None
-        return RatingBreakdown(
-            overall=self._as_float(raw.get("overall")),
-            athleticism=self._as_float(raw.get("athleticism")),
-            technical=self._as_float(raw.get("technical")),
-            intangibles=self._as_float(raw.get("intangibles")),
-            potential=self._as_float(raw.get("potential")),
-        )
 
-    def _parse_stats(self, raw: object) -> dict[str, float] | None:
-        if raw is None or not isinstance(raw, Mapping):
-            return None
-        stats: dict[str, float] = {}
-        for key, value in raw.items():
-            if key is None:
-                continue
-            key_text = str(key)
-            number = self._as_float(value)
-            if number is None:
-                continue
-            stats[key_text] = number
-        return stats or None
-
-    def _read_parquet(self, *, name: str) -> Any:
+    def _write_snapshot(self, df: Any, *, name: str, stamp: str) -> None:
+        """Best-effort uncompressed IPC snapshot so later opens can memory-map the table.
+
+        The old stamp is dropped before the snapshot is swapped and the new one is
+        written last, so an interrupted write never pairs a stamp with the wrong rows.
+        """
+        snapshot_path = self._snapshot_path_for(name)
+        stamp_path = self._stamp_path_for(name)
+        tmp_path = snapshot_path.with_name(f"{snapshot_path.name}.tmp")
+        tmp_stamp_path = stamp_path.with_name(f"{stamp_path.name}.tmp")
+        try:
+            df.write_ipc(tmp_path, compression="uncompressed")
+            stamp_path.unlink(missing_ok=True)
+            tmp_path.replace(snapshot_path)
+            tmp_stamp_path.write_text(stamp, encoding="utf-8")
+            tmp_stamp_path.replace(stamp_path)
+        except (OSError, pl.exceptions.PolarsError):
+            tmp_path.unlink(missing_ok=True)
+            tmp_stamp_path.unlink(missing_ok=True)
+
+    def _scan_parquet(
+        self,
+        *,
+        name: str,
+        columns: Sequence[str] | None = None,
+        predicate: Any = None,
+    ) -> Any:
+        """Return a lazy scan of a table with optional projection and filter pushdown."""
         path = self._path_for(name)
         if not path.exists():
             raise NotFoundError(f"Parquet table {name} not found at {path}")
 
+        self._require_polars()
         try:
-            import polars as pl
-        except ImportError as exc:  # pragma: no cover - optional dependency at runtime
-            raise MissingDependencyError("polars is required to load Parquet datasets") from exc
-
-        try:
-            return pl.read_parquet(path)
+            lf = pl.scan_parquet(path)
+            if columns is not None:
+                available = lf.collect_schema()
+                lf = lf.select([column for column in columns if column in available])
         except Exception as exc:  # pragma: no cover - surface IO errors
             raise DataValidationError(f"Failed to read Parquet table {name}: {exc}") from exc
+        if predicate is not None:
+            lf = lf.filter(predicate)
+        return lf
 
-    def _load_entity_table(self, name: str) -> list[EntitySummary]:
-        if name in self._entity_cache:
-            return self._entity_cache[name]
-
-        df = self._read_parquet(name=name)
-        columns = set(getattr(df, "columns", ()))
-        schema = self._schema_for(name)
-        required_columns = set(schema.fields) if schema else {"id", "name"}
-        missing_required = required_columns.difference(columns)
-        if missing_required:
-            raise DataValidationError(
-                f"Table {name} is missing required columns: {', '.join(sorted(missing_required))}"
-            )
+    @staticmethod
+    def _column_values(df: Any, column: str) -> list[Any]:
+        """Return one column as a Python list; absent optional columns read as nulls."""
+        if column not in df.columns:
+            return [None] * df.height
+        return cast(list[Any], df.get_column(column).to_list())
+
+    def _text_values(self, df: Any, column: str) -> list[str | None]:
+        """Column normalised like `_normalize_text`; string columns strip/null-blank in Polars."""
+        if column not in df.columns:
+            return [None] * df.height
+        series = df.get_column(column)
+        if series.dtype == pl.Utf8:
+            stripped = series.str.strip_chars()
+            return cast(list[str | None], stripped.replace("", None).to_list())
+        return [_normalize_text(value) for value in series.to_list()]
+
+    def _str_values(self, df: Any, column: str, *, default: str | None = None) -> list[str]:
+        """Column as `str(value)` or `str(value or default)`; null-free Utf8 skips per-cell work."""
+        series = df.get_column(column) if column in df.columns else None
+        if series is not None and series.dtype == pl.Utf8:
+            if default is not None:
+                series = series.replace("", None).fill_null(default)
+            if series.null_count() == 0:
+                return cast(list[str], series.to_list())
+        raw_values = series.to_list() if series is not None else [None] * df.height
+        if default is not None:
+            return [str(value or default) for value in raw_values]
+        return [str(value) for value in raw_values]
+
+    def _bool_values(self, df: Any, column: str) -> list[bool]:
+        """Column as `bool(value or False)`; Boolean dtype only fills nulls."""
+        if column in df.columns and df.get_column(column).dtype == pl.Boolean:
+            return cast(list[bool], df.get_column(column).fill_null(False).to_list())
+        return [bool(value or False) for value in self._column_values(df, column)]
+
+    def _interned_values(
+        self, df: Any, column: str, *, normalize: bool = True, default: str | None = None
+    ) -> list[Any]:
+        """Column for a low-cardinality field; equal strings share one interned object.
+
+        With `normalize=False` values are stringified like `_str_values` instead of normalised.
+        """
+        if normalize:
+            values: list[Any] = self._text_values(df, column)
+        else:
+            values = self._str_values(df, column, default=default)
+        lookup: dict[Any, Any] = {}
+        for value in set(values):
+            lookup[value] = sys.intern(value) if isinstance(value, str) else value
+        return [lookup[value] for value in values]
+
+    def _int_values(self, df: Any, column: str) -> list[int | None]:
+        """Column as ints; numeric dtypes use a native cast, others the `_as_int` fallback."""
+        if column not in df.columns:
+            return [None] * df.height
+        series = df.get_column(column)
+        if series.dtype.is_numeric() or series.dtype == pl.Boolean:
+            return cast(list[int | None], series.cast(pl.Int64, strict=False).to_list())
+        return [_as_int(value) for value in series.to_list()]
+
+    def _date_values(self, df: Any, column: str) -> list[date | None]:
+        """Column as dates; Date/Datetime dtypes skip the `_normalize_date` ladder."""
+        if column not in df.columns:
+            return [None] * df.height
+        series = df.get_column(column)
+        if series.dtype == pl.Date:
+            return cast(list[date | None], series.to_list())
+        if isinstance(series.dtype, pl.Datetime):
+            return cast(list[date | None], series.dt.date().to_list())
+        raw_values = series.to_list()
+        if series.dtype == pl.Utf8:
+            # Plain YYYY-MM-DD parses natively; other ISO forms fall back per row.
+            parsed = series.str.to_date(format="%Y-%m-%d", strict=False)
+            return [
+                _normalize_date(raw) if value is None and raw is not None else value
+                for raw, value in zip(raw_values, parsed.to_list())
+            ]
+        return [_normalize_date(value) for value in raw_values]
+
+    def _datetime_values(self, df: Any, column: str) -> list[datetime | None]:
+        """Column as datetimes; Date/Datetime dtypes skip the `_normalize_datetime` ladder."""
+        if column not in df.columns:
+            return [None] * df.height
+        series = df.get_column(column)
+        if isinstance(series.dtype, pl.Datetime):
+            return cast(list[datetime | None], series.to_list())
+        if series.dtype == pl.Date:
+            return cast(list[datetime | None], series.cast(pl.Datetime).to_list())
+        raw_values = series.to_list()
+        if series.dtype == pl.Utf8:
+            # Parse natively, then send only the rows Polars left null through the
+            # Python ladder. Offset-bearing strings come back as UTC, which would drop
+            # the original tzinfo, so those columns keep the Python path.
+            try:
+                parsed = series.str.strip_chars().str.to_datetime(strict=False)
+            except pl.exceptions.PolarsError:
+                parsed = None
+            if parsed is not None and parsed.dtype.time_zone is None:
+                return [
+                    _normalize_datetime(raw) if value is None and raw is not None else value
+                    for raw, value in zip(raw_values, parsed.to_list())
+                ]
+        return [_normalize_datetime(value) for value in raw_values]
+
+    def _projection(
+        self, name: str, columns: Sequence[str]
+    ) -> tuple[frozenset[str], list[str]]:
+        """Return the required columns of `name` and the projection to read for `columns`."""
+        required = self._required_columns(name)
+        return required, [*columns, *sorted(required.difference(columns))]
+
+    def _decode_columns(
+        self, df: Any, columns: Sequence[str], typed: Mapping[str, Any]
+    ) -> dict[str, list[Any]]:
+        """Pull each column once through its `typed` extractor (raw values by default).
+
+        Callers zip the lists into rows; avoids a per-row dict from `to_dicts()`.
+        """
+        return {column: typed.get(column, self._column_values)(df, column) for column in columns}
+
+    def _load_lock(self, name: str) -> threading.Lock:
+        return self._load_locks.setdefault(name, threading.Lock())
+
+    def _load_entity_table(self, name: str) -> tuple[EntitySummary, ...]:
+        cached = self._entity_cache.get(name)
+        if cached is not None:
+            return cached
+        with self._load_lock(name):
+            cached = self._entity_cache.get(name)
+            if cached is not None:
+                return cached
+            return self._read_entity_table(name)
+
+    def _read_entity_table(self, name: str) -> tuple[EntitySummary, ...]:
+        required, projection = self._projection(name, _ENTITY_COLUMNS)
+        df = self._read_parquet(name=name, columns=projection)
+        self._check_required_columns(name, required, df)
+
+        typed = {
+            "entity_type": self._interned_values,
+            "era": self._interned_values,
+            "team": self._interned_values,
+            "position": self._interned_values,
+            "schema_version": self._interned_values,
+            "source": self._interned_values,
+            "updated_at": self._date_values,
+            "logo_url": self._text_values,
+            "logo_path": self._text_values,
+            "id": self._str_values,
+            "name": self._str_values,
+        }
+        values = self._decode_columns(df, _ENTITY_COLUMNS, typed)
+        # Ids feed both the rows and the id→entity map.
+        ids = values["id"]
 
+        default_entity_type = name.rstrip("s")
+        # Flyweight cache scoped to this load (slotted models can't be weakly referenced).
+        ratings_cache: dict[tuple[float | None, ...], RatingBreakdown] = {}
         records: list[EntitySummary] = []
-        for row in df.to_dicts():
-            entity_type = self._normalize_text(row.get("entity_type")) or name.rstrip("s")
-            era = self._normalize_text(row.get("era"))
-            team = self._normalize_text(row.get("team"))
-            position = self._normalize_text(row.get("position"))
-            logo_url = self._normalize_text(row.get("logo_url"))
-            logo_path = self._normalize_text(row.get("logo_path"))
-            schema_version = (
-                self._normalize_text(row.get("schema_version")) or self.schema_version
-            )
-            source = self._normalize_text(row.get("source"))
-
+        for (
+            entity_id,
+            entity_name,
+            entity_type,
+            era,
+            team,
+            position,
+            ratings,
+            stats,
+            schema_version,
+            source,
+            updated_at,
+            logo_url,
+            logo_path,
+        ) in zip(*values.values()):
             records.append(
                 EntitySummary(
-                    id=str(row["id"]),
-                    name=str(row["name"]),
-                    entity_type=str(entity_type),
+                    id=entity_id,
+                    name=entity_name,
+                    entity_type=entity_type or default_entity_type,
                     era=era,
                     team=team,
                     position=position,
-                    ratings=self._parse_ratings(row.get("ratings")),
-                    stats=self._parse_stats(row.get("stats")),
-                    schema_version=schema_version,
+                    ratings=self._parse_ratings(ratings, cache=ratings_cache),
+                    stats=self._parse_stats(stats),
+                    schema_version=schema_version or self.schema_version,
                     source=source,
-                    updated_at=self._normalize_date(row.get("updated_at")),
+                    updated_at=updated_at,
                     logo_url=logo_url,
                     logo_path=logo_path,
                 )
             )
 
-        self._entity_cache[name] = records
-        # Rebuild id→index map for this table (repository is single owner)
-        self._rebuild_index_for_table(name, records)
-        return records
-
-    def _rebuild_index_for_table(self, name: str, records: list[EntitySummary]) -> None:
-        """Rebuild id→index map when entity cache is loaded/reloaded."""
-        if name == "players":
-            self._players_by_id = {entity.id: idx for idx, entity in enumerate(records)}
-        elif name == "teams":
-            self._teams_by_id = {entity.id: idx for idx, entity in enumerate(records)}
-        elif name == "coaches":
-            self._coaches_by_id = {entity.id: idx for idx, entity in enumerate(records)}
+        frozen = tuple(records)
+        # Publish the index before the cache so a cache hit always finds it.
+        self._id_index[name] = dict(zip(ids, frozen))
+        self._entity_cache[name] = frozen
+        return frozen
 
     def iter_players(self) -> Iterable[EntitySummary]:
         return self._load_entity_table("players")
@@ -245,27 +611,32 @@ class ParquetSummaryRepository:
 
     def get_player_by_id(self, player_id: str) -> EntitySummary:
         """O(1) lookup by player id using index."""
-        players = self._load_entity_table("players")
-        idx = self._players_by_id.get(player_id)
-        if idx is None:
+        self._load_entity_table("players")
+        player = self._id_index["players"].get(player_id)
+        if player is None:
             raise NotFoundError(f"Player {player_id} not found")
-        return players[idx]
+        return player
 
     def get_team_by_id(self, team_id: str) -> EntitySummary:
         """O(1) lookup by team id using index."""
-        teams = self._load_entity_table("teams")
-        idx = self._teams_by_id.get(team_id)
-        if idx is None:
+        self._load_entity_table("teams")
+        team = self._id_index["teams"].get(team_id)
+        if team is None:
             raise NotFoundError(f"Team {team_id} not found")
-        return teams[idx]
+        return team
 
     def get_coach_by_id(self, coach_id: str) -> EntitySummary:
         """O(1) lookup by coach id using index."""
-        coaches = self._load_entity_table("coaches")
-        idx = self._coaches_by_id.get(coach_id)
-        if idx is None:
+        self._load_entity_table("coaches")
+        coach = self._id_index["coaches"].get(coach_id)
+        if coach is None:
             raise NotFoundError(f"Coach {coach_id} not found")
-        return coaches[idx]
+        return coach
+
+    def try_get_player(self, player_id: str) -> EntitySummary | None:
+        """Lookup by player id that returns None instead of raising NotFoundError."""
+        self._load_entity_table("players")
+        return self._id_index["players"].get(player_id)
 
     def get_player(self, player_id: str) -> EntitySummary:
         """Backward compatibility wrapper for get_player_by_id."""
@@ -279,67 +650,142 @@ class ParquetSummaryRepository:
         """Backward compatibility wrapper for get_coach_by_id."""
         return self.get_coach_by_id(coach_id)
 
-    def iter_games(self) -> Iterable[GameSummary]:
-        if self._games_cache is not None:
-            return self._games_cache
-
-        df = self._read_parquet(name="games")
-        columns = set(getattr(df, "columns", ()))
-        schema = self._schema_for("games")
-        required = set(schema.fields) if schema else {
-            "id",
-            "season",
-            "week",
-            "home_team",
-            "away_team",
-            "start_time",
-            "status",
+    def _games_from_frame(self, df: Any, *, required: frozenset[str]) -> list[GameSummary]:
+        self._check_required_columns("games", required, df)
+
+        raw_interned = partial(self._interned_values, normalize=False)
+        typed = {
+            "id": self._str_values,
+            "home_team": raw_interned,
+            "away_team": raw_interned,
+            "location": partial(self._str_values, default=""),
+            "status": partial(raw_interned, default="scheduled"),
+            "is_postseason": self._bool_values,
+            "playoff_round": self._interned_values,
+            "season": self._int_values,
+            "week": self._int_values,
+            "home_score": self._int_values,
+            "away_score": self._int_values,
+            "start_time": self._datetime_values,
         }
-        missing = required.difference(columns)
-        if missing:
-            raise DataValidationError(
-                f"Table games is missing required columns: {', '.join(sorted(missing))}"
-            )
-
+        values = self._decode_columns(df, _GAME_COLUMNS, typed)
         games: list[GameSummary] = []
-        for row in df.to_dicts():
-            start_time = self._normalize_datetime(row.get("start_time"))
+        for (
+            game_id,
+            season,
+            week,
+            home_team,
+            away_team,
+            location,
+            start_time,
+            status,
+            is_postseason,
+            home_score,
+            away_score,
+            playoff_round,
+        ) in zip(*values.values()):
             if start_time is None:
-                raise DataValidationError(f"Invalid start_time for game {row.get('id')}")
-
-            season = self._as_int(row.get("season"))
-            week = self._as_int(row.get("week"))
+                raise DataValidationError(f"Invalid start_time for game {game_id}")
             if season is None or week is None:
-                raise DataValidationError(f"Invalid season/week for game {row.get('id')}")
+                raise DataValidationError(f"Invalid season/week for game {game_id}")
 
             games.append(
                 GameSummary(
-                    id=str(row["id"]),
+                    id=game_id,
                     season=season,
                     week=week,
-                    home_team=str(row["home_team"]),
-                    away_team=str(row["away_team"]),
-                    location=str(row.get("location") or ""),
+                    home_team=home_team,
+                    away_team=away_team,
+                    location=location,
                     start_time=start_time,
-                    status=str(row.get("status") or "scheduled"),
-                    is_postseason=bool(row.get("is_postseason") or False),
-                    home_score=self._as_int(row.get("home_score")),
-                    away_score=self._as_int(row.get("away_score")),
-                    playoff_round=self._normalize_text(row.get("playoff_round")),
+                    status=status,
+                    is_postseason=is_postseason,
+                    home_score=home_score,
+                    away_score=away_score,
+                    playoff_round=playoff_round,
                 )
             )
-
-        self._games_cache = games
         return games
 
+    def iter_games(self) -> Iterable[GameSummary]:
+        if self._games_cache is not None:
+            return self._games_cache
+
+        with self._load_lock("games"):
+            if self._games_cache is not None:
+                return self._games_cache
+            required, projection = self._projection("games", _GAME_COLUMNS)
+            df = self._read_parquet(name="games", columns=projection)
+            games = self._games_from_frame(df, required=required)
+            self._games_cache = games
+            return games
+
+    def prefetch_all(self) -> None:
+        """Load players, teams, coaches and games concurrently.
+
+        Polars releases the GIL while reading and decoding Parquet, so the tables
+        overlap. Every load is awaited; the first failure (in table order) is raised.
+        """
+
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="parquet-load") as pool:
+            futures: list[Future[Any]] = [
+                pool.submit(self._load_entity_table, "players"),
+                pool.submit(self._load_entity_table, "teams"),
+                pool.submit(self._load_entity_table, "coaches"),
+                pool.submit(self.iter_games),
+            ]
+        for future in futures:
+            future.result()
+
+    def iter_games_filtered(
+        self,
+        *,
+        season: int | None = None,
+        week: int | None = None,
+        team: str | None = None,
+    ) -> list[GameSummary]:
+        """Return games matching season/week/team without loading the whole table.
+
+        Filters are pushed into a lazy Parquet scan so row groups whose statistics
+        cannot match are skipped. Served from the in-memory cache when it is warm.
+        """
+
+        if self._games_cache is not None:
+            return [
+                game
+                for game in self._games_cache
+                if (season is None or game.season == season)
+                and (week is None or game.week == week)
+                and (team is None or team in (game.home_team, game.away_team))
+            ]
+
+        self._require_polars()
+        predicates = []
+        if season is not None:
+            predicates.append(pl.col("season") == season)
+        if week is not None:
+            predicates.append(pl.col("week") == week)
+        if team is not None:
+            predicates.append((pl.col("home_team") == team) | (pl.col("away_team") == team))
+
+        required, projection = self._projection("games", _GAME_COLUMNS)
+        lf = self._scan_parquet(
+            name="games",
+            columns=projection,
+            predicate=pl.all_horizontal(predicates) if predicates else None,
+        )
+        try:
+            df = lf.collect(engine="streaming")
+        except Exception as exc:  # pragma: no cover - surface IO errors
+            raise DataValidationError(f"Failed to read Parquet table games: {exc}") from exc
+        return self._games_from_frame(df, required=required)
+
     def clear_cache(self) -> None:
         """Drop in-memory caches (useful for long-running UIs after data refresh)."""
 
         self._entity_cache.clear()
         self._games_cache = None
-        self._players_by_id.clear()
-        self._teams_by_id.clear()
-        self._coaches_by_id.clear()
+        self._id_index.clear()
 
     def validate_schema(self) -> None:
         """Placeholder for schema validation logic."""
@@ -3,13 +3,41 @@
 from __future__ import annotations
 
 import logging
-from typing import Iterable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable
 
 from gridironlabs.core.errors import MissingDependencyError
 from gridironlabs.core.models import EntitySummary
 
 logger = logging.getLogger(__name__)
 
+# Concurrent logo downloads; also the connection pool size of the shared session.
+LOGO_DOWNLOAD_WORKERS = 8
+# Team metadata is effectively static; refetch it at most once per bucket.
+TEAMS_CACHE_SECONDS = 3600
+
+
+@lru_cache(maxsize=1)
+def _load_teams_cached(ttl_bucket: int) -> Any:
+    """Return `nflreadpy.load_teams()`, memoised per `ttl_bucket` (failures are not cached)."""
+    import nflreadpy  # type: ignore
+
+    return nflreadpy.load_teams()
+
+
+def _download_logo(session: Any, abbr: str, url: str, local_path: Path) -> None:
+    try:
+        resp = session.get(url, timeout=10)
+        if resp.status_code == 200:
+            local_path.write_bytes(resp.content)
+        else:
+            logger.warning("Failed to download logo for %s (status %d)", abbr, resp.status_code)
+    except Exception as exc:
+        logger.warning("Error downloading logo for %s: %s", abbr, exc)
+
 
 class NFLReadPyAdapter:
     """Placeholder adapter to wrap nflreadpy usage."""
@@ -31,7 +59,7 @@ class NFLReadPyAdapter:
         if not self.enabled:
             return []
         try:
-            import nflreadpy  # type: ignore  # pragma: no cover
+            import nflreadpy  # type: ignore  # noqa: F401  # pragma: no cover
             import requests
         except ImportError as exc:  # pragma: no cover
             raise MissingDependencyError("nflreadpy or requests is not installed") from exc
@@ -43,7 +71,7 @@ class NFLReadPyAdapter:
         logo_dir.mkdir(parents=True, exist_ok=True)
 
         try:
-            df = nflreadpy.load_teams()
+            df = _load_teams_cached(int(time.time() // TEAMS_CACHE_SECONDS))
         except Exception as exc:
             # If nflreadpy fails (network, etc.), return empty
             logger.warning("Failed to load teams from nflreadpy: %s", exc)
@@ -60,6 +88,7 @@ class NFLReadPyAdapter:
             # Assume pandas
             records = df.to_dict(orient="records")
 
+        teams: list[tuple[str, str, Any, Path]] = []
         for row in records:
             abbr = row.get("team_abbr")
             url = row.get("team_logo_espn")
@@ -67,18 +96,21 @@ class NFLReadPyAdapter:
 
             if not abbr or not name:
                 continue
-
-            local_path = logo_dir / f"{abbr}.png"
-            if url and not local_path.exists():
-                try:
-                    resp = requests.get(url, timeout=10)
-                    if resp.status_code == 200:
-                        local_path.write_bytes(resp.content)
-                    else:
-                        logger.warning("Failed to download logo for %s (status %d)", abbr, resp.status_code)
-                except Exception as exc:
-                    logger.warning("Error downloading logo for %s: %s", abbr, exc)
-
+            teams.append((abbr, name, url, logo_dir / f"{abbr}.png"))
+
+        # Fetch missing logos concurrently over one pooled session (connection reuse).
+        # Keyed by path so a team listed twice is only fetched once.
+        missing = {path: (abbr, url) for abbr, _, url, path in teams if url and not path.exists()}
+        if missing:
+            with requests.Session() as session:
+                adapter = requests.adapters.HTTPAdapter(pool_maxsize=LOGO_DOWNLOAD_WORKERS)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                with ThreadPoolExecutor(max_workers=LOGO_DOWNLOAD_WORKERS) as pool:
+                    for path, (abbr, url) in missing.items():
+                        pool.submit(_download_logo, session, abbr, url, path)
+
+        for abbr, name, url, local_path in teams:
             summaries.append(
                 EntitySummary(
                     id=f"team-{abbr}",
@@ -2,18 +2,47 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Sequence
 
 from gridironlabs.core.models import EntitySummary, SearchResult
 from gridironlabs.data.repository import SummaryRepository
 
+_NGRAM = 3
+
 
 @dataclass
 class SearchIndex:
     players: Sequence[EntitySummary]
     teams: Sequence[EntitySummary]
     coaches: Sequence[EntitySummary]
+    # Derived: entities in result order, their lowercased names, and trigram → positions.
+    entities: tuple[EntitySummary, ...] = field(init=False, repr=False)
+    names: tuple[str, ...] = field(init=False, repr=False)
+    trigrams: dict[str, frozenset[int]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.entities = (*self.players, *self.teams, *self.coaches)
+        self.names = tuple(entity.name.lower() for entity in self.entities)
+        postings: dict[str, set[int]] = {}
+        for position, name in enumerate(self.names):
+            for start in range(len(name) - _NGRAM + 1):
+                postings.setdefault(name[start : start + _NGRAM], set()).add(position)
+        self.trigrams = {gram: frozenset(hits) for gram, hits in postings.items()}
+
+    def candidates(self, lowered: str) -> Sequence[int]:
+        """Positions whose names may contain `lowered`, in result order."""
+        if len(lowered) < _NGRAM:
+            return range(len(self.names))
+        postings = []
+        for start in range(len(lowered) - _NGRAM + 1):
+            hits = self.trigrams.get(lowered[start : start + _NGRAM])
+            if not hits:
+                return ()
+            postings.append(hits)
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
 
 
 class SearchService:
@@ -24,31 +53,36 @@ class SearchService:
         self.index: SearchIndex | None = None
 
     def build_index(self) -> None:
-        self.index = SearchIndex(
-            players=list(self.repository.iter_players()),
-            teams=list(self.repository.iter_teams()),
-            coaches=list(self.repository.iter_coaches()),
-        )
+        # The three tables are independent reads; cold loads overlap while polars decodes.
+        repository = self.repository
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="search-index") as pool:
+            players, teams, coaches = pool.map(
+                lambda load: list(load()),
+                (repository.iter_players, repository.iter_teams, repository.iter_coaches),
+            )
+        self.index = SearchIndex(players=players, teams=teams, coaches=coaches)
 
     def search(self, query: str, limit: int = 10) -> list[SearchResult]:
         if not query:
             return []
         if self.index is None:
             self.build_index()
+        index = self.index
         lowered = query.lower()
         results: list[SearchResult] = []
-        for collection in (self.index.players, self.index.teams, self.index.coaches):
-            for entity in collection:
-                if lowered in entity.name.lower():
-                    results.append(
-                        SearchResult(
-                            id=entity.id,
-                            label=entity.name,
-                            entity_type=entity.entity_type,
-                            score=None,
-                            context={"team": entity.team or "", "position": entity.position or ""},
-                        )
+        # Trigram hits are only candidates; the substring check below is authoritative.
+        for position in index.candidates(lowered):
+            if lowered in index.names[position]:
+                entity = index.entities[position]
+                results.append(
+                    SearchResult(
+                        id=entity.id,
+                        label=entity.name,
+                        entity_type=entity.entity_type,
+                        score=None,
+                        context={"team": entity.team or "", "position": entity.position or ""},
                     )
+                )
                 if len(results) >= limit:
                     return results
         return results
@@ -40,12 +40,9 @@ class SummaryService:
     def compare(
         self, *, entity_ids: Sequence[str], advanced_metrics: bool = False
     ) -> ComparisonView:
-        entities: list[EntitySummary] = []
-        for entity_id in entity_ids:
-            try:
-                entities.append(self.get_player(entity_id))
-            except Exception:
-                pass
+        # Unknown ids are skipped; read errors propagate.
+        lookup = self.repository.try_get_player
+        entities = [entity for entity in map(lookup, entity_ids) if entity is not None]
         return ComparisonView(
             entities=entities,
             metric_keys=tuple(),
@@ -14,12 +14,17 @@ import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 from PySide6.QtCore import QPoint, QRect, Qt
 from PySide6.QtGui import QFontInfo, QGuiApplication, QImage, QPixmap
 from PySide6.QtWidgets import QApplication, QAbstractScrollArea, QWidget
 
+try:  # Optional accelerator for large widget-tree payloads.
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None
+
 
 @dataclass(frozen=True)
 class SnapshotResolution:
@@ -37,6 +42,10 @@ def ensure_dir(path: Path) -> None:
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
     ensure_dir(path.parent)
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        path.write_bytes(orjson.dumps(payload, option=options))
+        return
     path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
 
 
@@ -268,10 +277,17 @@ def list_candidate_panels(root: QWidget) -> list[dict[str, Any]]:
     return out
 
 
-def scroll_diagnostics(root: QWidget) -> list[dict[str, Any]]:
-    """Collect scroll/viewport metrics for any QAbstractScrollArea in subtree."""
+def scroll_diagnostics(
+    root: QWidget, *, areas: Sequence[QAbstractScrollArea] | None = None
+) -> list[dict[str, Any]]:
+    """Collect scroll/viewport metrics for any QAbstractScrollArea in subtree.
+
+    Pass `areas` when the caller already walked the subtree, to avoid a second walk.
+    """
     out: list[dict[str, Any]] = []
-    for area in root.findChildren(QAbstractScrollArea):
+    if areas is None:
+        areas = root.findChildren(QAbstractScrollArea)
+    for area in areas:
         try:
             vbar = area.verticalScrollBar()
             hbar = area.horizontalScrollBar()
@@ -515,6 +515,7 @@ class GridironLabsMainWindow(QMainWindow):
             self.repository = ParquetSummaryRepository(
                 self.paths.data_processed, schema_version=self.config.default_schema_version
             )
+            self.repository.prefetch_all()
             players = list(self.repository.iter_players())
             teams = list(self.repository.iter_teams())
             coaches = list(self.repository.iter_coaches())
@@ -1,5 +1,234 @@
+import os
+from datetime import date, datetime
+
 import pytest
 
+from gridironlabs.core.errors import DataValidationError, NotFoundError
+from gridironlabs.data.repository import ParquetSummaryRepository
+
+pl = pytest.importorskip("polars")
+
+
+def _write_players(root, **overrides):
+    data = {
+        "id": ["p1", "p2"],
+        "name": ["Alpha Back", "Beta End"],
+        "position": ["RB", " "],
+        "team": ["KC", None],
+        "era": ["modern", "modern"],
+        "ratings": [{"overall": 88.5, "potential": 91.0}, {"overall": 70.0, "potential": 65.5}],
+        "stats": [{"yards": 1200.0}, {"yards": 0.0}],
+        "updated_at": [date(2024, 9, 1), None],
+    }
+    data.update(overrides)
+    pl.from_dict(data).write_parquet(root / "players.parquet")
+
+
+def test_players_roundtrip_preserves_fields(tmp_path):
+    _write_players(tmp_path)
+    repo = ParquetSummaryRepository(tmp_path)
+
+    players = list(repo.iter_players())
+    assert [p.id for p in players] == ["p1", "p2"]
+
+    first, second = players
+    assert first.entity_type == "player"
+    assert first.team == "KC"
+    assert first.position == "RB"
+    assert first.updated_at == date(2024, 9, 1)
+    assert first.schema_version == "v0"
+    assert first.stats == {"yards": 1200.0}
+    assert first.ratings is not None
+    assert (first.ratings.overall, first.ratings.potential) == (88.5, 91.0)
+    assert first.ratings.athleticism is None
+
+    # Blank strings and nulls normalise to None; absent optional columns read as nulls.
+    assert second.position is None
+    assert second.team is None
+    assert second.source is None
+    assert second.logo_url is None
+
+    assert repo.get_player_by_id("p2") is second
+    assert repo.try_get_player("p1") is first
+    assert repo.try_get_player("missing") is None
+    # Low-cardinality text columns share one interned string per distinct value.
+    assert first.era is second.era
+
+
+def test_missing_required_column_raises(tmp_path):
+    pl.from_dict({"id": ["p1"], "name": ["Alpha Back"]}).write_parquet(
+        tmp_path / "players.parquet"
+    )
+    repo = ParquetSummaryRepository(tmp_path)
+
+    with pytest.raises(DataValidationError):
+        list(repo.iter_players())
+
+
+def _write_games(root):
+    pl.from_dict(
+        {
+            "id": ["g1", "g2"],
+            "season": [2024, 2024],
+            "week": [1, 19],
+            "home_team": ["KC", "BUF"],
+            "away_team": ["BAL", "MIA"],
+            "location": ["Arrowhead", None],
+            "start_time": [datetime(2024, 9, 5, 20, 20), datetime(2025, 1, 12, 13, 0)],
+            "status": ["final", None],
+            "is_postseason": [False, True],
+            "playoff_round": [None, "Wild Card"],
+            "home_score": [27, None],
+            "away_score": [20, None],
+        }
+    ).write_parquet(root / "games.parquet")
+
+
+def test_games_roundtrip_parses_schedule(tmp_path):
+    _write_games(tmp_path)
+    repo = ParquetSummaryRepository(tmp_path)
+
+    regular, playoff = list(repo.iter_games())
+    assert regular.start_time == datetime(2024, 9, 5, 20, 20)
+    assert (regular.home_score, regular.away_score) == (27, 20)
+    assert regular.status == "final"
+    assert playoff.location == ""
+    assert playoff.status == "scheduled"
+    assert playoff.is_postseason is True
+    assert playoff.playoff_round == "Wild Card"
+    assert playoff.home_score is None
+
+
+def test_entity_reads_skip_unused_columns(tmp_path, monkeypatch):
+    _write_players(tmp_path, scouting_notes=["long text", "more text"])
+    repo = ParquetSummaryRepository(tmp_path)
+
+    seen: list[list[str] | None] = []
+    real_read = pl.read_parquet
+
+    def spy(path, *, columns=None, **kwargs):
+        seen.append(columns)
+        return real_read(path, columns=columns, **kwargs)
+
+    monkeypatch.setattr(pl, "read_parquet", spy)
+    assert [p.id for p in repo.iter_players()] == ["p1", "p2"]
+    assert seen and "scouting_notes" not in seen[0]
+    assert "source" not in seen[0]  # optional column absent from the file
+
+
+def test_filtered_games_match_cached_filter(tmp_path):
+    _write_games(tmp_path)
+    repo = ParquetSummaryRepository(tmp_path)
+
+    scanned = repo.iter_games_filtered(season=2024, team="MIA")
+    assert [g.id for g in scanned] == ["g2"]
+    assert repo.iter_games_filtered(week=1)[0].home_team == "KC"
+    assert repo.iter_games_filtered(season=1999) == []
+
+    list(repo.iter_games())
+    assert repo.iter_games_filtered(season=2024, team="MIA") == scanned
+
+
+def test_games_accept_string_typed_columns(tmp_path):
+    pl.from_dict(
+        {
+            "id": ["g1"],
+            "season": [" 2024 "],
+            "week": ["3"],
+            "home_team": ["KC"],
+            "away_team": ["BAL"],
+            "location": [None],
+            "start_time": ["2024-09-22 13:00:00"],
+            "status": ["scheduled"],
+            "is_postseason": [False],
+            "playoff_round": [None],
+            "home_score": [None],
+            "away_score": [None],
+        },
+        schema_overrides={"home_score": pl.Utf8, "away_score": pl.Utf8},
+    ).write_parquet(tmp_path / "games.parquet")
+    repo = ParquetSummaryRepository(tmp_path)
+
+    (game,) = repo.iter_games()
+    assert (game.season, game.week) == (2024, 3)
+    assert game.start_time == datetime(2024, 9, 22, 13, 0)
+    assert game.home_score is None
+
+
+def test_snapshot_reused_until_parquet_changes(tmp_path, monkeypatch):
+    _write_players(tmp_path)
+    parquet_path = tmp_path / "players.parquet"
+    os.utime(parquet_path, ns=(1_000_000_000, 1_000_000_000))
+    first = list(ParquetSummaryRepository(tmp_path).iter_players())
+    assert (tmp_path / "players.ipc").exists()
+
+    parquet_reads: list[object] = []
+    real_read = pl.read_parquet
+    monkeypatch.setattr(
+        pl, "read_parquet", lambda path, **kw: parquet_reads.append(path) or real_read(path, **kw)
+    )
+    assert list(ParquetSummaryRepository(tmp_path).iter_players()) == first
+    assert parquet_reads == []
+
+    _write_players(tmp_path, name=["Renamed Back", "Beta End"])
+    reloaded = list(ParquetSummaryRepository(tmp_path).iter_players())
+    assert reloaded[0].name == "Renamed Back"
+    assert parquet_reads == [parquet_path]
+
+
+def test_snapshot_rebuilt_when_parquet_replaced_with_older_mtime(tmp_path):
+    _write_players(tmp_path)
+    assert [p.name for p in ParquetSummaryRepository(tmp_path).iter_players()][0] == "Alpha Back"
+
+    # e.g. `cp -p` / `rsync -a` restoring an older file next to a newer snapshot
+    _write_players(tmp_path, name=["Restored Back", "Beta End"])
+    os.utime(tmp_path / "players.parquet", ns=(1_000_000_000, 1_000_000_000))
+
+    restored, _ = ParquetSummaryRepository(tmp_path).iter_players()
+    assert restored.name == "Restored Back"
+
+
+def test_snapshot_not_shared_across_schema_versions(tmp_path, monkeypatch):
+    _write_players(tmp_path)
+    list(ParquetSummaryRepository(tmp_path).iter_players())
+
+    parquet_reads: list[object] = []
+    real_read = pl.read_parquet
+    monkeypatch.setattr(
+        pl, "read_parquet", lambda path, **kw: parquet_reads.append(path) or real_read(path, **kw)
+    )
+    list(ParquetSummaryRepository(tmp_path, schema_version="v1").iter_players())
+    assert parquet_reads == [tmp_path / "players.parquet"]
+
+
+def test_prefetch_all_fills_every_cache(tmp_path):
+    _write_players(tmp_path)
+    _write_games(tmp_path)
+    for table in ("teams", "coaches"):
+        pl.read_parquet(tmp_path / "players.parquet").with_columns(
+            logo_url=pl.lit(None, dtype=pl.Utf8), logo_path=pl.lit(None, dtype=pl.Utf8)
+        ).write_parquet(tmp_path / f"{table}.parquet")
+    repo = ParquetSummaryRepository(tmp_path)
+
+    repo.prefetch_all()
+
+    assert repo.iter_players() is repo.iter_players()
+    assert repo.get_coach_by_id("p1").name == "Alpha Back"
+    assert [g.id for g in repo.iter_games()] == ["g1", "g2"]
+
+
+def test_prefetch_all_raises_missing_table(tmp_path):
+    _write_players(tmp_path)
+    repo = ParquetSummaryRepository(tmp_path)
+
+    with pytest.raises(NotFoundError):
+        repo.prefetch_all()
+
+
+def test_string_updated_at_parses_iso_dates(tmp_path):
+    _write_players(tmp_path, updated_at=["2024-09-01", "20240902"])
+    repo = ParquetSummaryRepository(tmp_path)
 
-def test_parquet_roundtrip_placeholder():
-    pytest.skip("Parquet round-trip integration test pending implementation.")
+    first, second = repo.iter_players()
+    assert first.updated_at == date(2024, 9, 1)
+    assert second.updated_at == date(2024, 9, 2)
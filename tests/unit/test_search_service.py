@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from gridironlabs.core.models import EntitySummary
+from gridironlabs.services.search import SearchService
+
+
+def _entity(entity_id: str, name: str, entity_type: str) -> EntitySummary:
+    return EntitySummary(id=entity_id, name=name, entity_type=entity_type, team="KC")
+
+
+class _Repository:
+    def __init__(self) -> None:
+        self.players = [
+            _entity("p1", "Patrick Mahomes", "player"),
+            _entity("p2", "Travis Kelce", "player"),
+            _entity("p3", "Isiah Pacheco", "player"),
+        ]
+        self.teams = [_entity("t1", "Kansas City Chiefs", "team")]
+        self.coaches = [_entity("c1", "Andy Reid", "coach")]
+
+    def iter_players(self):
+        return self.players
+
+    def iter_teams(self):
+        return self.teams
+
+    def iter_coaches(self):
+        return self.coaches
+
+
+def _naive_ids(repo: _Repository, query: str) -> list[str]:
+    lowered = query.lower()
+    entities = [*repo.players, *repo.teams, *repo.coaches]
+    return [e.id for e in entities if lowered in e.name.lower()]
+
+
+def test_search_matches_substring_scan_in_result_order():
+    repo = _Repository()
+    service = SearchService(repo)
+
+    for query in ("a", "ce", "PAT", "kelce", "city ch", "reid", "zzz", "s c"):
+        assert [r.id for r in service.search(query, limit=100)] == _naive_ids(repo, query)
+
+
+def test_search_respects_limit_and_fills_result_fields():
+    service = SearchService(_Repository())
+
+    results = service.search("a", limit=2)
+    assert [r.id for r in results] == ["p1", "p2"]
+    assert results[0].label == "Patrick Mahomes"
+    assert results[0].entity_type == "player"
+    assert results[0].context == {"team": "KC", "position": ""}
+    assert service.search("") == []
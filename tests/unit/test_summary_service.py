@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import pytest
+
+from gridironlabs.core.errors import DataValidationError, NotFoundError
+from gridironlabs.core.models import EntitySummary
+from gridironlabs.data.repository import SummaryRepository
+from gridironlabs.services.summary import SummaryService
+
+
+class _Repository(SummaryRepository):
+    def __init__(self, *players: EntitySummary) -> None:
+        self.players = {player.id: player for player in players}
+
+    def get_player(self, player_id: str) -> EntitySummary:
+        if player_id == "broken":
+            raise DataValidationError("unreadable players table")
+        try:
+            return self.players[player_id]
+        except KeyError:
+            raise NotFoundError(f"Player {player_id} not found") from None
+
+
+def _player(player_id: str) -> EntitySummary:
+    return EntitySummary(id=player_id, name=player_id.title(), entity_type="player")
+
+
+def test_compare_skips_unknown_ids_in_order():
+    service = SummaryService(_Repository(_player("p1"), _player("p2")))
+
+    view = service.compare(entity_ids=["p2", "missing", "p1"], advanced_metrics=True)
+    assert [e.id for e in view.entities] == ["p2", "p1"]
+    assert view.advanced_metrics_enabled is True
+
+
+def test_compare_surfaces_repository_errors():
+    service = SummaryService(_Repository(_player("p1")))
+
+    with pytest.raises(DataValidationError):
+        service.compare(entity_ids=["p1", "broken"])